@@ -5,9 +5,9 @@ Contains all display-related configuration and driver code
 """
 
 import time
+import threading
 import spidev
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
 import os
 
 # Try RPi.GPIO first for Pi 5 (more reliable), fallback to gpiozero
@@ -38,6 +38,14 @@ DISPLAY2_RST_PIN = 23 # GPIO 23
 WIDTH = 240
 HEIGHT = 240
 
+def _read_spidev_bufsiz():
+    """Read the spidev transfer size limit (None if it can't be read)"""
+    try:
+        with open('/sys/module/spidev/parameters/bufsiz') as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
 class GC9A01:
     """GC9A01 display driver for Raspberry Pi"""
     
@@ -67,6 +75,17 @@ class GC9A01:
         self.spi.max_speed_hz = 150000000  # 150 MHz (conservative Pi 5 optimization)
         self.spi.mode = 0
         
+        # writebytes2 splits a frame into bufsiz-sized transfers - warn if a frame won't fit in one
+        self.spi_bufsiz = _read_spidev_bufsiz()
+        if self.spi_bufsiz and self.spi_bufsiz < WIDTH * HEIGHT * 2:
+            print(f"spidev bufsiz is {self.spi_bufsiz} bytes - each frame takes "
+                  f"{-(-WIDTH * HEIGHT * 2 // self.spi_bufsiz)} SPI transfers (run install.sh to raise it)")
+        
+        # Address window currently set in the controller and the frame it shows (for dirty rectangles)
+        self.window = None
+        self.last_frame = None
+        self.bytes_sent = 0  # Pixel bytes written since the last performance report
+        
         # Initialize display
         self._init_display()
     
@@ -184,123 +203,72 @@ class GC9A01:
         if hasattr(self, 'spi'):
             self.spi.close()
 
-def create_eye_image(eye_x, eye_y, blink_state=1.0, eye_cache=None, cache_size=50, eye_color=None, iris_radius=None):
-    """Create eye image with blinking support + RGB565 pre-conversion + dynamic sizing"""
-    # Default eye color if not provided
-    if eye_color is None:
-        eye_color = [200, 50, 25]  # Red
-    
-    # Dynamic iris radius (default 50 if not provided)
-    if iris_radius is None:
-        iris_radius = 50  # Default size
-    pupil_radius = iris_radius // 2  # Pupil is half the iris size
-    
-    # Round to nearest 5 pixels for smoother movement (still good caching)
-    cache_x = round(eye_x / 5) * 5
-    cache_y = round(eye_y / 5) * 5
-    blink_key = round(blink_state * 10) / 10  # Cache different blink states
-    color_key = tuple(eye_color)  # Add color to cache key
-    size_key = iris_radius  # Add iris size to cache key
-    cache_key = (cache_x, cache_y, blink_key, color_key, size_key)
+class FrameSlot:
+    """Single-frame mailbox between a renderer and its SPI writer - a newer frame replaces an unsent one"""
     
-    # Check cache first (cache stores RGB565 bytes directly!)
-    if cache_key in eye_cache:
-        return eye_cache[cache_key]
+    def __init__(self):
+        self.frame = None
+        self.ready = threading.Event()
     
-    # Render directly at full resolution for better quality
-    render_size = WIDTH  # 240x240 full resolution
+    def put(self, frame):
+        """Publish a frame - overwrites any frame the writer has not picked up yet"""
+        self.frame = frame
+        self.ready.set()
     
-    # Create full resolution image for rendering
-    img_array = np.zeros((render_size, render_size, 3), dtype=np.uint8)
-    
-    # Use full resolution coordinates
-    render_x = int(eye_x)
-    render_y = int(eye_y)
-    
-    # Dynamic eye sizes based on face size
-    # iris_radius and pupil_radius are now calculated above
-    
-    # Calculate eye position (clamp to render bounds with margin)
-    render_x = int(max(iris_radius, min(render_size - iris_radius, render_x)))
-    render_y = int(max(iris_radius, min(render_size - iris_radius, render_y)))
-    
-    # Apply blink (compress vertically)
-    y, x = np.ogrid[:render_size, :render_size]
+    def get(self, timeout=None):
+        """Wait for the newest frame, None on timeout"""
+        if not self.ready.wait(timeout):
+            return None
+        # Clear before reading - a frame published in between is picked up (at worst sent twice), never lost
+        self.ready.clear()
+        return self.frame
+
+def send_to_display(display, rgb565_bytes):
+    """Send RGB565 data to a specific display - only the rectangle that changed since the last frame"""
+    # Frames are sent by reference and compared against later, so they must not be modified afterwards
+    frame = np.frombuffer(rgb565_bytes, dtype=np.uint16).reshape(HEIGHT, WIDTH)
     
-    if blink_state < 1.0:
-        # Create eyelid effect (close from top and bottom)
-        eyelid_top = int(render_size//2 - (render_size//2) * blink_state)
-        eyelid_bottom = int(render_size//2 + (render_size//2) * blink_state)
-        
-        # Only draw eye in visible area
-        if eyelid_bottom > eyelid_top:
-            # Add glow effect around iris with blink mask
-            glow_radius = iris_radius + 15  # Glow extends 15 pixels beyond iris
-            mask_glow = ((x - render_x)**2 + (y - render_y)**2 <= glow_radius**2) & (y >= eyelid_top) & (y <= eyelid_bottom)
-            # Create glow with reduced intensity
-            glow_color = [int(c * 0.3) for c in eye_color]  # 30% intensity for glow
-            img_array[mask_glow] = glow_color
-            
-            # Draw iris with blink mask
-            mask_iris = ((x - render_x)**2 + (y - render_y)**2 <= iris_radius**2) & (y >= eyelid_top) & (y <= eyelid_bottom)
-            img_array[mask_iris] = eye_color  # Dynamic eye color
-            
-            # Draw pupil (white circle) with blink mask
-            mask_pupil = ((x - render_x)**2 + (y - render_y)**2 <= pupil_radius**2) & (y >= eyelid_top) & (y <= eyelid_bottom)
-            img_array[mask_pupil] = [255, 255, 255]  # White pupil
+    # Find the bounding box of the pixels that differ from what the display shows -
+    # the compare takes microseconds, every byte saved on SPI is worth far more
+    if display.last_frame is None:
+        x0, y0, x1, y1 = 0, 0, WIDTH - 1, HEIGHT - 1
     else:
-        # Fully open eye
-        # Add glow effect around iris
-        glow_radius = iris_radius + 15  # Glow extends 15 pixels beyond iris
-        mask_glow = (x - render_x)**2 + (y - render_y)**2 <= glow_radius**2
-        # Create glow with reduced intensity
-        glow_color = [int(c * 0.3) for c in eye_color]  # 30% intensity for glow
-        img_array[mask_glow] = glow_color
-        
-        # Draw iris
-        mask_iris = (x - render_x)**2 + (y - render_y)**2 <= iris_radius**2
-        img_array[mask_iris] = eye_color  # Dynamic eye color
-        
-        # Draw pupil
-        mask_pupil = (x - render_x)**2 + (y - render_y)**2 <= pupil_radius**2
-        img_array[mask_pupil] = [255, 255, 255]  # White pupil
-    
-    # Convert RGB888 to RGB565 using NumPy (direct conversion - no scaling needed!)
-    r = (img_array[:, :, 0] >> 3).astype(np.uint16)  # 5 bits
-    g = (img_array[:, :, 1] >> 2).astype(np.uint16)  # 6 bits
-    b = (img_array[:, :, 2] >> 3).astype(np.uint16)  # 5 bits
-    rgb565_full = (r << 11) | (g << 5) | b
-    
-    # Convert to bytes (big-endian for SPI) - no scaling needed!
-    rgb565_bytes = rgb565_full.astype('>u2').tobytes()
+        changed = frame != display.last_frame
+        changed_rows = np.flatnonzero(changed.any(axis=1))
+        if changed_rows.size == 0:
+            return  # Same image - nothing to send
+        changed_cols = np.flatnonzero(changed.any(axis=0))
+        y0, y1 = int(changed_rows[0]), int(changed_rows[-1])
+        x0, x1 = int(changed_cols[0]), int(changed_cols[-1])
     
-    # Cache management - keep only recent entries
-    if len(eye_cache) >= cache_size:
-        # Remove oldest entry
-        eye_cache.pop(next(iter(eye_cache)))
-    
-    # Cache the RGB565 bytes directly!
-    eye_cache[cache_key] = rgb565_bytes
-    return rgb565_bytes
-
-def send_to_display(display, rgb565_bytes):
-    """Send RGB565 data to a specific display"""
-    # Set display window
-    display._write_command(0x2A)  # Column address set
-    display._write_data([0x00, 0x00, 0x00, 0xEF])  # 0 to 239
-    display._write_command(0x2B)  # Row address set
-    display._write_data([0x00, 0x00, 0x00, 0xEF])  # 0 to 239
+    # Set display window - CASET/RASET persist in the controller, so only write them when the rectangle moves
+    window = (x0, y0, x1, y1)
+    if window != display.window:
+        display._write_command(0x2A)  # Column address set
+        display._write_data([x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF])
+        display._write_command(0x2B)  # Row address set
+        display._write_data([y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF])
+        display.window = window
     display._write_command(0x2C)  # Memory write
     
-    # Send full screen data using display's own GPIO handling
+    # Send rectangle data using display's own GPIO handling
     # Set data mode
     if USE_GPIOZERO:
         display.dc_device.on()  # Data mode
     else:
         GPIO.output(display.dc_pin, GPIO.HIGH)  # Data mode
     
-    # Send data in optimized chunks (safe size for Pi 5)
-    chunk_size = 4096  # Safe chunk size for SPI (Pi 5 can handle this reliably)
-    for i in range(0, len(rgb565_bytes), chunk_size):
-        chunk = rgb565_bytes[i:i+chunk_size]
-        display.spi.writebytes(chunk)  # SPI handles CS automatically
+    # Full-width rows are one contiguous run of the frame (no copy), a narrower rectangle
+    # is gathered into a small buffer first
+    if x0 == 0 and x1 == WIDTH - 1:
+        data = frame[y0:y1 + 1]
+    else:
+        data = np.ascontiguousarray(frame[y0:y1 + 1, x0:x1 + 1])
+    
+    # Send the rectangle in one call - writebytes2 takes any buffer and only splits
+    # it at the spidev bufsiz (set spidev.bufsiz=131072 for a single transfer per frame).
+    # It hands the buffer pointer straight to ioctl(SPI_IOC_MESSAGE) in C, so there is no
+    # per-byte Python work or copy left to move into a custom extension
+    display.spi.writebytes2(data)
+    display.bytes_sent += data.nbytes
+    display.last_frame = frame
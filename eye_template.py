@@ -63,6 +63,127 @@ if platform.system() == "Windows":
 else:
     from display_settings import WIDTH, HEIGHT
 
+def _to_rgb565(rgb):
+    """Pack uint8 RGB values (last axis) into RGB565"""
+    rgb = rgb.astype(np.uint16)
+    return ((rgb[..., 0] >> 3) << 11) | ((rgb[..., 1] >> 2) << 5) | (rgb[..., 2] >> 3)
+
+# Pre-rendered eye sprites keyed by look (color, iris size, pupil shape),
+# and the color-independent layer masks they are painted from
+_eye_sprites = {}
+_eye_geometries = {}
+_EYE_SPRITE_CACHE_SIZE = 16
+
+def _get_eye_sprite(eye_color, iris_radius, pupil_width, pupil_height):
+    """Get the RGB565 eye sprite for this look, rendering it on first use"""
+    sprite_key = (tuple(eye_color), iris_radius, pupil_width, pupil_height)
+    sprite = _eye_sprites.get(sprite_key)
+    if sprite is None:
+        sprite = _render_eye_sprite(eye_color, iris_radius, pupil_width, pupil_height)
+        if len(_eye_sprites) >= _EYE_SPRITE_CACHE_SIZE:
+            # Remove oldest entry
+            _eye_sprites.pop(next(iter(_eye_sprites)))
+        _eye_sprites[sprite_key] = sprite
+    return sprite
+
+def _get_eye_geometry(iris_radius, pupil_width, pupil_height):
+    """Get the color-independent layer masks for an eye shape, computing them on first use"""
+    geometry_key = (iris_radius, pupil_width, pupil_height)
+    geometry = _eye_geometries.get(geometry_key)
+    if geometry is None:
+        geometry = _compute_eye_geometry(iris_radius, pupil_width, pupil_height)
+        if len(_eye_geometries) >= _EYE_SPRITE_CACHE_SIZE:
+            # Remove oldest entry
+            _eye_geometries.pop(next(iter(_eye_geometries)))
+        _eye_geometries[geometry_key] = geometry
+    return geometry
+
+def _compute_eye_geometry(iris_radius, pupil_width, pupil_height):
+    """Compute layer masks and the iris gradient from one distance field"""
+    # Layer sizes
+    glow_radius = iris_radius + EYE_CONFIG['glow_size']
+    highlight_width = EYE_CONFIG['edge_highlight']['width']
+    outer_edge = iris_radius + highlight_width/2
+    inner_edge = iris_radius - highlight_width/2
+    
+    # Sprite just covers the outermost layer, centered on the eye
+    half = int(np.floor(max(glow_radius, outer_edge)))
+    
+    # Squared distances from the eye center - computed once, shared by every layer
+    grid_y, grid_x = np.ogrid[-half:half + 1, -half:half + 1]
+    dx_squared = grid_x**2  # (1, size)
+    dy_squared = grid_y**2  # (size, 1)
+    dist_squared = dx_squared + dy_squared
+    
+    # Round glow, edge highlight ring (and whether it sits on glow or black), round iris
+    mask_glow = dist_squared <= glow_radius**2
+    mask_highlight = (dist_squared >= inner_edge**2) & (dist_squared <= outer_edge**2)
+    highlight_on_glow = (dist_squared[mask_highlight] <= glow_radius**2)[:, None]
+    mask_iris = dist_squared <= iris_radius**2
+    
+    # Calculate normalized distance from center (0.0 at center, 1.0 at edge)
+    dist_normalized = np.sqrt(dist_squared[mask_iris]) / iris_radius
+    
+    # Gradient multiplier: bright center, smooth transition to darker edge
+    gradient_size = EYE_CONFIG['iris_gradient']['gradient_size']
+    center_brightness = EYE_CONFIG['iris_gradient']['center_brightness']
+    edge_darkness = EYE_CONFIG['iris_gradient']['edge_darkness']
+    gradient_mult = np.where(
+        dist_normalized <= gradient_size,
+        center_brightness,
+        center_brightness + (edge_darkness - center_brightness) * ((dist_normalized - gradient_size) / (1.0 - gradient_size))
+    ).reshape(-1, 1)
+    
+    # Elliptical pupil
+    mask_pupil = (dx_squared / (pupil_width**2)) + (dy_squared / (pupil_height**2)) <= 1
+    
+    return half, mask_glow, mask_highlight, highlight_on_glow, mask_iris, gradient_mult, mask_pupil
+
+def _render_eye_sprite(eye_color, iris_radius, pupil_width, pupil_height):
+    """Render glow, edge highlight, gradient iris and pupil into a square big-endian RGB565 sprite"""
+    # Shapes are shared by every color - only the color math runs per sprite (fast color fades)
+    half, mask_glow, mask_highlight, highlight_on_glow, mask_iris, gradient_mult, mask_pupil = \
+        _get_eye_geometry(iris_radius, pupil_width, pupil_height)
+    sprite = np.zeros((2 * half + 1, 2 * half + 1), dtype='>u2')
+    
+    # Add glow effect around iris
+    # Create glow with configurable intensity
+    glow_color = np.array([int(c * EYE_CONFIG['glow_intensity']) for c in eye_color], dtype=np.uint8)
+    sprite[mask_glow] = _to_rgb565(glow_color)
+    
+    # Add bright edge highlight between glow and iris
+    highlight_brightness = EYE_CONFIG['edge_highlight']['brightness']
+    highlight_alpha = EYE_CONFIG['edge_highlight']['alpha']
+    
+    # Create bright highlight color
+    highlight_color = np.clip(np.array(eye_color) * highlight_brightness, 0, 255).astype(np.uint8)
+    
+    # Blend highlight with existing colors (glow inside the glow radius, black outside)
+    under_highlight = np.where(highlight_on_glow, glow_color, 0)
+    sprite[mask_highlight] = _to_rgb565((
+        (1 - highlight_alpha) * under_highlight + 
+        highlight_alpha * highlight_color
+    ).astype(np.uint8))
+    
+    # Apply gradient to each color channel of the iris
+    iris_color = np.array(eye_color)
+    gradient_colors = np.clip(iris_color.reshape(1, 3) * gradient_mult, 0, 255).astype(np.uint8)
+    sprite[mask_iris] = _to_rgb565(gradient_colors)  # Apply gradient colors
+    
+    # Draw pupil with BLACK color
+    sprite[mask_pupil] = 0  # Black pupil
+    
+    return sprite
+
+def _rgb565_to_bgr(rgb565_bytes):
+    """Unpack a big-endian RGB565 frame into a BGR888 image (for OpenCV preview)"""
+    rgb565 = np.frombuffer(rgb565_bytes, dtype='>u2').reshape(HEIGHT, WIDTH).astype(np.uint16)
+    bgr = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    bgr[..., 0] = (rgb565 & 0x1F) << 3
+    bgr[..., 1] = ((rgb565 >> 5) & 0x3F) << 2
+    bgr[..., 2] = (rgb565 >> 11) << 3
+    return bgr
+
 def get_eye_colors():
     """Get the current eye colors from the template"""
     return {
@@ -91,174 +212,61 @@ def create_eye_image(eye_x, eye_y, blink_state=1.0, eye_cache=None, cache_size=5
     pupil_width = int(pupil_radius * pupil_config['width_ratio'])  # Width (1.0 for round, <1.0 for elliptical)
     pupil_height = int(pupil_radius * pupil_config['height_ratio'])  # Height
     
-    # Round to nearest 5 pixels for smoother movement (still good caching)
-    cache_x = round(eye_x / 5) * 5
-    cache_y = round(eye_y / 5) * 5
-    blink_key = round(blink_state * 10) / 10  # Cache different blink states
-    color_key = tuple(eye_color)  # Add color to cache key
-    size_key = iris_radius  # Add iris size to cache key
-    face_key = face_tracked  # Add face tracking state to cache key
-    pupil_size_key = round(pupil_size_factor * 10) / 10  # Add pupil size factor to cache key
-    cache_key = (cache_x, cache_y, blink_key, color_key, size_key, face_key, pupil_size_key)
-    
-    # Check cache first (cache stores RGB565 bytes directly!)
-    if cache_key in eye_cache:
-        return eye_cache[cache_key]
+    # Check cache first (cache stores RGB565 bytes directly!) - eye_cache=None renders uncached
+    # and skips building the key altogether
+    if eye_cache is not None:
+        # Round to nearest 5 pixels for smoother movement (still good caching)
+        cache_x = round(eye_x / 5) * 5
+        cache_y = round(eye_y / 5) * 5
+        blink_key = round(blink_state * 10) / 10  # Cache different blink states
+        color_key = tuple(eye_color)  # Add color to cache key
+        size_key = iris_radius  # Add iris size to cache key
+        face_key = face_tracked  # Add face tracking state to cache key
+        pupil_size_key = round(pupil_size_factor * 10) / 10  # Add pupil size factor to cache key
+        cache_key = (cache_x, cache_y, blink_key, color_key, size_key, face_key, pupil_size_key)
+        if cache_key in eye_cache:
+            return eye_cache[cache_key]
     
     # Render directly at full resolution for better quality
     render_size = WIDTH  # 240x240 full resolution
     
-    # Create full resolution image for rendering
-    img_array = np.zeros((render_size, render_size, 3), dtype=np.uint8)
-    
-    # Use full resolution coordinates
-    render_x = int(eye_x)
-    render_y = int(eye_y)
-    
-    # Dynamic eye sizes based on face size
-    # iris_radius and pupil_radius are now calculated above
+    # Compose straight into the big-endian RGB565 wire format (no RGB888 frame, no conversion pass)
+    # The frame is a view of the buffer that gets sent, so there is no tobytes() copy at the end
+    rgb565_bytes = bytearray(render_size * render_size * 2)
+    frame = np.frombuffer(rgb565_bytes, dtype='>u2').reshape(render_size, render_size)
     
     # Calculate eye position (clamp to render bounds with margin)
-    render_x = int(max(iris_radius, min(render_size - iris_radius, render_x)))
-    render_y = int(max(iris_radius, min(render_size - iris_radius, render_y)))
+    render_x = max(iris_radius, min(render_size - iris_radius, int(eye_x)))
+    render_y = max(iris_radius, min(render_size - iris_radius, int(eye_y)))
     
-    # Apply blink (compress vertically)
-    y, x = np.ogrid[:render_size, :render_size]
+    # The eye itself only depends on its look, not its position - draw it once, then just blit
+    sprite = _get_eye_sprite(eye_color, iris_radius, pupil_width, pupil_height)
+    half = sprite.shape[0] // 2
     
+    # Only rows the sprite covers are drawn (everything else stays black)
+    row_top = max(0, render_y - half)
+    row_bottom = min(render_size - 1, render_y + half)
+    
+    # Apply blink (close from top and bottom) by narrowing the row window:
+    # fully open eyes skip the eyelid math, fully closed ones shrink to a single row
     if blink_state < 1.0:
-        # Create eyelid effect (close from top and bottom)
         eyelid_top = render_y - iris_radius + (iris_radius * (1 - blink_state))
         eyelid_bottom = render_y + iris_radius - (iris_radius * (1 - blink_state))
-        
-        # Add glow effect around iris (only visible part) - round shape for outer glow
-        glow_radius = iris_radius + EYE_CONFIG['glow_size']
-        mask_glow = ((x - render_x)**2 + (y - render_y)**2 <= glow_radius**2) & (y >= eyelid_top) & (y <= eyelid_bottom)
-        # Create glow with configurable intensity
-        glow_color = [int(c * EYE_CONFIG['glow_intensity']) for c in eye_color]
-        img_array[mask_glow] = glow_color
-        
-        # Add bright edge highlight between glow and iris (only visible part)
-        highlight_width = EYE_CONFIG['edge_highlight']['width']
-        highlight_brightness = EYE_CONFIG['edge_highlight']['brightness']
-        highlight_alpha = EYE_CONFIG['edge_highlight']['alpha']
-        
-        # Create ring mask for the highlight
-        dist_squared = (x - render_x)**2 + (y - render_y)**2
-        outer_edge = iris_radius + highlight_width/2
-        inner_edge = iris_radius - highlight_width/2
-        mask_highlight = ((dist_squared >= inner_edge**2) & (dist_squared <= outer_edge**2)) & (y >= eyelid_top) & (y <= eyelid_bottom)
-        
-        # Create bright highlight color
-        highlight_color = np.clip(np.array(eye_color) * highlight_brightness, 0, 255).astype(np.uint8)
-        
-        # Blend highlight with existing colors
-        img_array[mask_highlight] = (
-            (1 - highlight_alpha) * img_array[mask_highlight] + 
-            highlight_alpha * highlight_color
-        ).astype(np.uint8)
-        
-        # Draw iris with gradient (only visible part) - round shape
-        mask_iris = ((x - render_x)**2 + (y - render_y)**2 <= iris_radius**2) & (y >= eyelid_top) & (y <= eyelid_bottom)
-        
-        # Calculate normalized distance from center (0.0 at center, 1.0 at edge)
-        dist_squared_iris = (x - render_x)**2 + (y - render_y)**2
-        dist_normalized = np.sqrt(dist_squared_iris[mask_iris]) / iris_radius
-        
-        # Create gradient multiplier (1.0 means no change)
-        gradient_size = EYE_CONFIG['iris_gradient']['gradient_size']
-        center_brightness = EYE_CONFIG['iris_gradient']['center_brightness']
-        edge_darkness = EYE_CONFIG['iris_gradient']['edge_darkness']
-        
-        # Smooth transition from center brightness to edge darkness
-        gradient_mult = np.ones_like(dist_normalized)
-        center_mask = dist_normalized <= gradient_size
-        gradient_mask = (dist_normalized > gradient_size)
-        
-        # Bright center
-        gradient_mult[center_mask] = center_brightness
-        
-        # Gradient from center to edge
-        gradient_range = dist_normalized[gradient_mask]
-        gradient_mult[gradient_mask] = center_brightness + (edge_darkness - center_brightness) * ((gradient_range - gradient_size) / (1.0 - gradient_size))
-        
-        # Apply gradient to each color channel
-        iris_color = np.array(eye_color)
-        gradient_colors = np.clip(iris_color.reshape(1, 3) * gradient_mult.reshape(-1, 1), 0, 255).astype(np.uint8)
-        img_array[mask_iris] = gradient_colors  # Apply gradient colors
-        
-        # Draw pupil (only visible part) - elliptical shape with BLACK color
-        mask_pupil = (((x - render_x)**2 / (pupil_width**2)) + ((y - render_y)**2 / (pupil_height**2)) <= 1) & (y >= eyelid_top) & (y <= eyelid_bottom)
-        img_array[mask_pupil] = [0, 0, 0]  # Black pupil
-    else:
-        # Fully open eye
-        # Add glow effect around iris - round shape for outer glow
-        glow_radius = iris_radius + EYE_CONFIG['glow_size']
-        mask_glow = (x - render_x)**2 + (y - render_y)**2 <= glow_radius**2
-        # Create glow with configurable intensity
-        glow_color = [int(c * EYE_CONFIG['glow_intensity']) for c in eye_color]
-        img_array[mask_glow] = glow_color
-        
-        # Add bright edge highlight between glow and iris
-        highlight_width = EYE_CONFIG['edge_highlight']['width']
-        highlight_brightness = EYE_CONFIG['edge_highlight']['brightness']
-        highlight_alpha = EYE_CONFIG['edge_highlight']['alpha']
-        
-        # Create ring mask for the highlight
-        dist_squared = (x - render_x)**2 + (y - render_y)**2
-        outer_edge = iris_radius + highlight_width/2
-        inner_edge = iris_radius - highlight_width/2
-        mask_highlight = (dist_squared >= inner_edge**2) & (dist_squared <= outer_edge**2)
-        
-        # Create bright highlight color
-        highlight_color = np.clip(np.array(eye_color) * highlight_brightness, 0, 255).astype(np.uint8)
-        
-        # Blend highlight with existing colors
-        img_array[mask_highlight] = (
-            (1 - highlight_alpha) * img_array[mask_highlight] + 
-            highlight_alpha * highlight_color
-        ).astype(np.uint8)
-        
-        # Draw iris with gradient - round shape
-        dist_squared = (x - render_x)**2 + (y - render_y)**2
-        mask_iris = dist_squared <= iris_radius**2
-        
-        # Calculate normalized distance from center (0.0 at center, 1.0 at edge)
-        dist_normalized = np.sqrt(dist_squared[mask_iris]) / iris_radius
-        
-        # Create gradient multiplier (1.0 means no change)
-        gradient_size = EYE_CONFIG['iris_gradient']['gradient_size']
-        center_brightness = EYE_CONFIG['iris_gradient']['center_brightness']
-        edge_darkness = EYE_CONFIG['iris_gradient']['edge_darkness']
-        
-        # Smooth transition from center brightness to edge darkness
-        gradient_mult = np.ones_like(dist_normalized)
-        center_mask = dist_normalized <= gradient_size
-        gradient_mask = (dist_normalized > gradient_size)
-        
-        # Bright center
-        gradient_mult[center_mask] = center_brightness
-        
-        # Gradient from center to edge
-        gradient_range = dist_normalized[gradient_mask]
-        gradient_mult[gradient_mask] = center_brightness + (edge_darkness - center_brightness) * ((gradient_range - gradient_size) / (1.0 - gradient_size))
-        
-        # Apply gradient to each color channel
-        iris_color = np.array(eye_color)
-        gradient_colors = np.clip(iris_color.reshape(1, 3) * gradient_mult.reshape(-1, 1), 0, 255).astype(np.uint8)
-        img_array[mask_iris] = gradient_colors  # Apply gradient colors
-        
-        # Draw pupil - elliptical shape with BLACK color
-        mask_pupil = ((x - render_x)**2 / (pupil_width**2)) + ((y - render_y)**2 / (pupil_height**2)) <= 1
-        img_array[mask_pupil] = [0, 0, 0]  # Black pupil
-    
-    # Convert RGB888 to RGB565 using NumPy (direct conversion - no scaling needed!)
-    r = (img_array[:, :, 0] >> 3).astype(np.uint16)  # 5 bits
-    g = (img_array[:, :, 1] >> 2).astype(np.uint16)  # 6 bits
-    b = (img_array[:, :, 2] >> 3).astype(np.uint16)  # 5 bits
-    rgb565_full = (r << 11) | (g << 5) | b
-    
-    # Convert to bytes (big-endian for SPI) - no scaling needed!
-    rgb565_bytes = rgb565_full.astype('>u2').tobytes()
+        row_top = max(row_top, int(np.ceil(eyelid_top)))
+        row_bottom = min(row_bottom, int(np.floor(eyelid_bottom)))
+    
+    if row_top <= row_bottom:
+        # Blit the visible part of the sprite (clipped at the screen edges)
+        col_left = max(0, render_x - half)
+        col_right = min(render_size - 1, render_x + half)
+        frame[row_top:row_bottom + 1, col_left:col_right + 1] = sprite[
+            row_top - render_y + half:row_bottom - render_y + half + 1,
+            col_left - render_x + half:col_right - render_x + half + 1]
+    
+    # rgb565_bytes already holds the big-endian RGB565 frame for SPI (writebytes2 takes any buffer)
+    
+    if eye_cache is None:
+        return rgb565_bytes
     
     # Cache management - keep only recent entries
     if len(eye_cache) >= cache_size:
@@ -304,89 +312,12 @@ def preview_eyes():
     normal_color = eye_colors['normal_color']
     tracked_color = eye_colors['tracked_color']
     
-    # Create images directly in BGR format for preview
+    # Preview shows exactly what the displays get - the same sprite renderer, decoded to BGR
     def create_eye_preview(eye_x, eye_y, eye_color, face_tracked=False):
-        """Create eye image directly in BGR format for preview"""
-        img_array = np.zeros((WIDTH, HEIGHT, 3), dtype=np.uint8)
-        
-        iris_radius = EYE_CONFIG['iris_radius']
-        
-        # Determine which pupil settings to use based on face tracking state (not color)
-        pupil_config = EYE_CONFIG['tracked_pupil'] if face_tracked else EYE_CONFIG['normal_pupil']
-        
-        # Calculate pupil dimensions
-        pupil_radius = int(iris_radius * pupil_config['size_ratio'])
-        pupil_width = int(pupil_radius * pupil_config['width_ratio'])
-        pupil_height = int(pupil_radius * pupil_config['height_ratio'])
-        
-        # Calculate eye position (clamp to bounds with margin)
-        render_x = int(max(iris_radius, min(WIDTH - iris_radius, eye_x)))
-        render_y = int(max(iris_radius, min(HEIGHT - iris_radius, eye_y)))
-        
-        # Create coordinate grids
-        y, x = np.ogrid[:WIDTH, :HEIGHT]
-        
-        # Add glow effect around iris - ROUND shape for outer glow
-        glow_radius = iris_radius + EYE_CONFIG['glow_size']
-        mask_glow = (x - render_x)**2 + (y - render_y)**2 <= glow_radius**2
-        glow_color = [int(c * EYE_CONFIG['glow_intensity']) for c in eye_color]
-        img_array[mask_glow] = glow_color
-        
-        # Add bright edge highlight between glow and iris
-        highlight_width = EYE_CONFIG['edge_highlight']['width']
-        highlight_brightness = EYE_CONFIG['edge_highlight']['brightness']
-        highlight_alpha = EYE_CONFIG['edge_highlight']['alpha']
-        
-        # Create ring mask for the highlight
-        dist_squared = (x - render_x)**2 + (y - render_y)**2
-        outer_edge = iris_radius + highlight_width/2
-        inner_edge = iris_radius - highlight_width/2
-        mask_highlight = (dist_squared >= inner_edge**2) & (dist_squared <= outer_edge**2)
-        
-        # Create bright highlight color
-        highlight_color = np.clip(np.array(eye_color) * highlight_brightness, 0, 255).astype(np.uint8)
-        
-        # Blend highlight with existing colors
-        img_array[mask_highlight] = (
-            (1 - highlight_alpha) * img_array[mask_highlight] + 
-            highlight_alpha * highlight_color
-        ).astype(np.uint8)
-        
-        # Draw iris with gradient - round shape
-        dist_squared = (x - render_x)**2 + (y - render_y)**2
-        mask_iris = dist_squared <= iris_radius**2
-        
-        # Calculate normalized distance from center (0.0 at center, 1.0 at edge)
-        dist_normalized = np.sqrt(dist_squared[mask_iris]) / iris_radius
-        
-        # Create gradient multiplier (1.0 means no change)
-        gradient_size = EYE_CONFIG['iris_gradient']['gradient_size']
-        center_brightness = EYE_CONFIG['iris_gradient']['center_brightness']
-        edge_darkness = EYE_CONFIG['iris_gradient']['edge_darkness']
-        
-        # Smooth transition from center brightness to edge darkness
-        gradient_mult = np.ones_like(dist_normalized)
-        center_mask = dist_normalized <= gradient_size
-        gradient_mask = (dist_normalized > gradient_size)
-        
-        # Bright center
-        gradient_mult[center_mask] = center_brightness
-        
-        # Gradient from center to edge
-        gradient_range = dist_normalized[gradient_mask]
-        gradient_mult[gradient_mask] = center_brightness + (edge_darkness - center_brightness) * ((gradient_range - gradient_size) / (1.0 - gradient_size))
-        
-        # Apply gradient to each color channel
-        iris_color = np.array(eye_color)
-        gradient_colors = np.clip(iris_color.reshape(1, 3) * gradient_mult.reshape(-1, 1), 0, 255).astype(np.uint8)
-        img_array[mask_iris] = gradient_colors  # Apply gradient colors
-        
-        # Draw pupil - elliptical shape with BLACK color
-        mask_pupil = ((x - render_x)**2 / (pupil_width**2)) + ((y - render_y)**2 / (pupil_height**2)) <= 1
-        img_array[mask_pupil] = [0, 0, 0]  # Black pupil
-        
-        # Convert RGB to BGR for OpenCV
-        return cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+        """Render an eye with create_eye_image and decode it to BGR for preview"""
+        rgb565_bytes = create_eye_image(eye_x, eye_y, 1.0, None, eye_color=eye_color,
+                                        iris_radius=EYE_CONFIG['iris_radius'], face_tracked=face_tracked)
+        return _rgb565_to_bgr(rgb565_bytes)
     
     # Create both eyes
     left_eye_bgr = create_eye_preview(left_eye_x, left_eye_y, normal_color, face_tracked=False)
@@ -4,7 +4,7 @@ Main loop for the eye tracker - separated to avoid indentation issues
 """
 
 import cv2
-import queue
+import os
 import time
 
 
@@ -25,15 +25,31 @@ def run_eye_tracker(eye_tracker):
     if not eye_tracker.init_face_detection():
         return False
     
+    # No X11/Wayland display to show a window on - don't pay for preview frames at all
+    if eye_tracker.enable_preview and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        print("No display attached - running without preview")
+        eye_tracker.enable_preview = False
+    
     eye_tracker.running = True
     
     # Start threads
     import threading
-    display_thread = threading.Thread(target=eye_tracker.display_thread_func, daemon=True)
-    display_thread.start()
+    eye_tracker.display_thread = threading.Thread(target=eye_tracker.display_thread_func, daemon=True)
+    eye_tracker.display_thread.start()
+    
+    eye_tracker._camera_thread = threading.Thread(target=eye_tracker.camera_thread, daemon=True)
+    eye_tracker._camera_thread.start()
     
-    camera_thread = threading.Thread(target=eye_tracker.camera_thread, daemon=True)
-    camera_thread.start()
+    # One SPI writer per display so frame transfers overlap with rendering
+    # (kept on the tracker so stop() can join them before closing the displays)
+    eye_tracker._spi_threads = [
+        threading.Thread(target=eye_tracker.spi_writer_thread,
+                         args=(eye_tracker.display1, eye_tracker.spi_slot_left), daemon=True),
+        threading.Thread(target=eye_tracker.spi_writer_thread,
+                         args=(eye_tracker.display2, eye_tracker.spi_slot_right), daemon=True)
+    ]
+    for spi_thread in eye_tracker._spi_threads:
+        spi_thread.start()
     
     if eye_tracker.enable_preview:
         print("Eye Tracker started with preview! Press 'q' in preview window to quit.")
@@ -41,56 +57,60 @@ def run_eye_tracker(eye_tracker):
         print("Eye Tracker started (no preview - max performance)! Press Ctrl+C to stop.")
     
     try:
+        # Preview window runs on this (main) thread - keep it off the camera/display cores
+        if eye_tracker.enable_preview:
+            eye_tracker.pin_current_thread(eye_tracker.preview_core)
+        
         # Main loop for OpenCV display (only if preview enabled)
         while eye_tracker.running and eye_tracker.enable_preview:
-            try:
-                frame, motion_boxes, faces = eye_tracker.frame_queue.get(timeout=1.0)
-                
-                # Convert to BGR for OpenCV (handle YUV420)
-                if len(frame.shape) == 3:
-                    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_YUV2BGR)
-                else:
-                    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-                
-                # Draw motion detection rectangles on frame
-                if motion_boxes is not None and len(motion_boxes) > 0:  # Check if not None and not empty
-                    for (x, y, w, h) in motion_boxes:
-                        cv2.rectangle(frame_bgr, (x, y), (x+w, y+h), (0, 255, 0), 2)
-                        # Draw center point
-                        center_x = x + w//2
-                        center_y = y + h//2
-                        cv2.circle(frame_bgr, (center_x, center_y), 5, (0, 0, 255), -1)
-                        # Add motion label
-                        cv2.putText(frame_bgr, 'Motion', (x, y-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-                
-                # Draw face detection rectangles on frame
-                if faces is not None and len(faces) > 0:  # Check if not None and not empty
-                    for (x, y, w, h) in faces:
-                        cv2.rectangle(frame_bgr, (x, y), (x+w, y+h), (0, 165, 255), 2)  # Orange color
-                        # Draw center point
-                        center_x = x + w//2
-                        center_y = y + h//2
-                        cv2.circle(frame_bgr, (center_x, center_y), 5, (0, 165, 255), -1)  # Orange color
-                        # Add face label
-                        cv2.putText(frame_bgr, 'Face', (x, y-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 165, 255), 1)
-                
-                # Add mode indicator
-                mode_text = "Red Eyes" if eye_tracker.face_detected else "Motion Detection"
-                mode_color = (0, 0, 255) if eye_tracker.face_detected else (0, 255, 0)
-                cv2.putText(frame_bgr, mode_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, mode_color, 2)
-                
-                # Flip image horizontally for mirror effect
-                frame_mirrored = cv2.flip(frame_bgr, 1)
-                
-                # Show mirrored image for better user experience
-                cv2.imshow('Eye Tracker Preview (Mirrored)', frame_mirrored)
-                
-                # Check for 'q' key press to quit
-                if cv2.waitKey(1) & 0xFF == ord('q'):
+            # No new preview frame yet - keep the window responsive while waiting
+            # (only this thread pops, so a non-empty deque still has its frame below)
+            if not eye_tracker.frame_queue:
+                if cv2.waitKey(10) & 0xFF == ord('q'):
                     break
-                    
-            except queue.Empty:
                 continue
+            
+            frame, motion_boxes, faces = eye_tracker.frame_queue.popleft()
+            
+            # Convert to BGR for OpenCV (frame is the grayscale Y plane)
+            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+            
+            # Draw motion detection rectangles on frame
+            if motion_boxes is not None and len(motion_boxes) > 0:  # Check if not None and not empty
+                for (x, y, w, h) in motion_boxes:
+                    cv2.rectangle(frame_bgr, (x, y), (x+w, y+h), (0, 255, 0), 2)
+                    # Draw center point
+                    center_x = x + w//2
+                    center_y = y + h//2
+                    cv2.circle(frame_bgr, (center_x, center_y), 5, (0, 0, 255), -1)
+                    # Add motion label
+                    cv2.putText(frame_bgr, 'Motion', (x, y-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+            
+            # Draw face detection rectangles on frame
+            if faces is not None and len(faces) > 0:  # Check if not None and not empty
+                for (x, y, w, h) in faces:
+                    cv2.rectangle(frame_bgr, (x, y), (x+w, y+h), (0, 165, 255), 2)  # Orange color
+                    # Draw center point
+                    center_x = x + w//2
+                    center_y = y + h//2
+                    cv2.circle(frame_bgr, (center_x, center_y), 5, (0, 165, 255), -1)  # Orange color
+                    # Add face label
+                    cv2.putText(frame_bgr, 'Face', (x, y-10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 165, 255), 1)
+            
+            # Add mode indicator
+            mode_text = "Red Eyes" if eye_tracker.face_detected else "Motion Detection"
+            mode_color = (0, 0, 255) if eye_tracker.face_detected else (0, 255, 0)
+            cv2.putText(frame_bgr, mode_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, mode_color, 2)
+            
+            # Flip image horizontally for mirror effect
+            frame_mirrored = cv2.flip(frame_bgr, 1)
+            
+            # Show mirrored image for better user experience
+            cv2.imshow('Eye Tracker Preview (Mirrored)', frame_mirrored)
+            
+            # Check for 'q' key press to quit
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
         
         # If no preview, just wait for Ctrl+C
         if not eye_tracker.enable_preview:
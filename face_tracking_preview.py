@@ -4,18 +4,25 @@ Face Tracking Preview - Separate code for face detection and size analysis
 Shows face detection with box size information and logs last 5 face sizes
 """
 
-from picamera2 import Picamera2
+from picamera2 import Picamera2, MappedArray
 import cv2
 import numpy as np
 import time
 import os
+import argparse
+from collections import deque
 
 class FaceTracker:
-    def __init__(self):
+    def __init__(self, headless=False):
         self.camera = None
         self.face_cascade = None
         self.running = False
         
+        # Preview window - overlay drawing is skipped when headless or window is hidden
+        self.window_name = 'Face Tracking Preview (Mirrored)'
+        self.draw_overlay = not headless
+        self.window_shown = False
+        
         # Face detection settings (same as main code)
         self.camera_width = 800
         self.camera_height = 600
@@ -23,8 +30,8 @@ class FaceTracker:
         self.face_detection_counter = 0
         
         # Face size logging
-        self.face_sizes = []  # Store last 5 face sizes
         self.max_face_history = 5
+        self.face_sizes = deque(maxlen=self.max_face_history)  # Store last 5 face sizes
         
         # Face detection parameters (same as main code)
         self.scale_factor = 1.1
@@ -56,7 +63,11 @@ class FaceTracker:
         """Initialize face detection with same settings as main code"""
         try:
             # Same cascade paths as main code
+            # LBP cascades first - integer pixel-comparison features, several times faster than Haar on the Pi
             cascade_paths = [
+                '/usr/share/opencv4/lbpcascades/lbpcascade_frontalface_improved.xml',
+                '/usr/local/share/opencv4/lbpcascades/lbpcascade_frontalface_improved.xml',
+                '/usr/share/opencv4/lbpcascades/lbpcascade_frontalface.xml',
                 '/usr/share/opencv4/haarcascades/haarcascade_frontalface_default.xml',
                 '/usr/local/share/opencv4/haarcascades/haarcascade_frontalface_default.xml',
                 '/usr/share/opencv/haarcascades/haarcascade_frontalface_default.xml',
@@ -86,6 +97,9 @@ class FaceTracker:
             if self.face_cascade.empty():
                 print("Failed to load face cascade")
                 return False
+            
+            # Warm up the cascade on a blank frame so its lazy setup isn't paid on the first real frame
+            self.face_cascade.detectMultiScale(np.zeros((self.camera_height, self.camera_width), dtype=np.uint8))
             print(f"Face detection initialized successfully using: {cascade_path}")
             return True
         except Exception as e:
@@ -97,11 +111,8 @@ class FaceTracker:
         if self.face_cascade is None:
             return []
         
-        # Convert frame to grayscale for face detection
-        if len(frame.shape) == 3:
-            gray = cv2.cvtColor(frame, cv2.COLOR_YUV2GRAY)
-        else:
-            gray = frame
+        # Frame is already the grayscale Y plane
+        gray = frame
         
         # Detect faces with same parameters as main code
         faces = self.face_cascade.detectMultiScale(
@@ -117,18 +128,15 @@ class FaceTracker:
     def update_face_sizes(self, faces):
         """Update face size history with last 5 face sizes"""
         if len(faces) > 0:
-            # Use the largest face (most prominent)
-            largest_face = max(faces, key=lambda f: f[2] * f[3])
+            # Use the largest face (most prominent) - vectorized area + argmax
+            areas = faces[:, 2].astype(np.int32) * faces[:, 3]
+            largest_face = faces[int(areas.argmax())]
             x, y, w, h = largest_face
             face_area = w * h
             
-            # Add to history
+            # Add to history - the deque drops anything older than the last 5
             self.face_sizes.append(face_area)
             
-            # Keep only last 5
-            if len(self.face_sizes) > self.max_face_history:
-                self.face_sizes.pop(0)
-            
             # Log face size
             print(f"Face detected: {w}x{h} pixels, Area: {face_area}")
             if len(self.face_sizes) > 1:
@@ -143,7 +151,8 @@ class FaceTracker:
         """Draw face detection info on frame"""
         if len(faces) > 0:
             # Use the largest face
-            largest_face = max(faces, key=lambda f: f[2] * f[3])
+            areas = faces[:, 2].astype(np.int32) * faces[:, 3]
+            largest_face = faces[int(areas.argmax())]
             x, y, w, h = largest_face
             
             # Draw face rectangle
@@ -179,30 +188,49 @@ class FaceTracker:
         
         self.running = True
         
-        print("Face Tracker started! Press 'q' in preview window to quit.")
+        if self.draw_overlay:
+            print("Face Tracker started! Press 'q' in preview window to quit.")
+        else:
+            print("Face Tracker started (headless)! Press Ctrl+C to stop.")
         print("Face sizes will be logged to console.")
         
         try:
             while self.running:
-                # Capture frame
-                frame = self.camera.capture_array()
-                
-                # Face detection (every 20 frames like main code)
-                faces = []
-                self.face_detection_counter += 1
-                
-                if self.face_detection_counter >= self.face_detection_interval:
-                    faces = self.detect_faces(frame)
-                    self.face_detection_counter = 0
-                    
-                    # Update face size history
-                    self.update_face_sizes(faces)
+                # Capture frame - zero-copy view of the camera buffer, released as soon as we are done.
+                # YUV420 comes back as one 2D buffer, keep only the Y plane (luma is all detection and
+                # the grayscale preview use; the chroma rows are not an image)
+                request = self.camera.capture_request()
+                try:
+                    with MappedArray(request, "main") as mapped:
+                        frame = mapped.array[:self.camera_height, :self.camera_width]
+                        
+                        # Face detection (every 20 frames like main code)
+                        faces = []
+                        self.face_detection_counter += 1
+                        
+                        if self.face_detection_counter >= self.face_detection_interval:
+                            faces = self.detect_faces(frame)
+                            self.face_detection_counter = 0
+                            
+                            # Update face size history
+                            self.update_face_sizes(faces)
+                        
+                        # Skip all preview work if nobody can see it (headless, minimized or closed window)
+                        window_hidden = self.window_shown and cv2.getWindowProperty(self.window_name, cv2.WND_PROP_VISIBLE) < 1
+                        
+                        # Convert to BGR for OpenCV (frame is the grayscale Y plane) - our own copy
+                        frame_bgr = None
+                        if self.draw_overlay and not window_hidden:
+                            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+                finally:
+                    request.release()
                 
-                # Convert to BGR for OpenCV
-                if len(frame.shape) == 3:
-                    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_YUV2BGR)
-                else:
-                    frame_bgr = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+                if frame_bgr is None:
+                    if self.draw_overlay:
+                        # Keep pumping GUI events so we notice when the window is visible again
+                        if cv2.waitKey(1) & 0xFF == ord('q'):
+                            break
+                    continue
                 
                 # Draw face detection info
                 frame_with_info = self.draw_face_info(frame_bgr, faces)
@@ -220,7 +248,8 @@ class FaceTracker:
                 frame_mirrored = cv2.flip(frame_with_info, 1)
                 
                 # Show preview
-                cv2.imshow('Face Tracking Preview (Mirrored)', frame_mirrored)
+                cv2.imshow(self.window_name, frame_mirrored)
+                self.window_shown = True
                 
                 # Check for 'q' key press to quit
                 if cv2.waitKey(1) & 0xFF == ord('q'):
@@ -246,12 +275,18 @@ class FaceTracker:
             print(f"Average size: {sum(self.face_sizes) / len(self.face_sizes):.0f}")
             print(f"Min size: {min(self.face_sizes)}")
             print(f"Max size: {max(self.face_sizes)}")
-            print(f"All sizes: {self.face_sizes}")
+            print(f"All sizes: {list(self.face_sizes)}")
         
         print("Face Tracker stopped")
 
 def main():
     """Main function"""
+    # Parse command-line arguments
+    parser = argparse.ArgumentParser(description='Face Tracking Preview')
+    parser.add_argument('--headless', action='store_true',
+                       help='Skip preview window and overlay drawing (face sizes are still logged)')
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("FACE TRACKING PREVIEW")
     print("Same settings as main eye tracker")
@@ -259,7 +294,7 @@ def main():
     print("Logs last 5 face sizes for analysis")
     print("=" * 60)
     
-    face_tracker = FaceTracker()
+    face_tracker = FaceTracker(headless=args.headless)
     face_tracker.run()
 
 if __name__ == "__main__":
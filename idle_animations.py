@@ -4,28 +4,64 @@ Idle Eye Animations Test
 Test various idle animations for the eye tracker before integrating into main code.
 """
 
+import os
 import time
 import math
 import random
-from display_settings import WIDTH, HEIGHT, GC9A01, send_to_display
+import threading
+from display_settings import (
+    WIDTH, HEIGHT, GC9A01, send_to_display, FrameSlot,
+    DISPLAY1_CS_PIN, DISPLAY1_DC_PIN, DISPLAY1_RST_PIN,
+    DISPLAY2_CS_PIN, DISPLAY2_DC_PIN, DISPLAY2_RST_PIN
+)
 from eye_template import create_eye_image
 
 class IdleAnimations:
     def __init__(self):
         self.current_animation = 0
-        self.animation_start_time = time.time()
+        self.animation_start_time = time.monotonic()
         self.animation_duration = 5.0  # Each animation runs for 10 seconds
         
+        # Debug output (positions, blink/sleep progress) - enable with EYE_DEBUG=1
+        self.debug = os.environ.get("EYE_DEBUG") == "1"
+        
         # Don't initialize displays - main system handles that
+        # (standalone test calls init_displays() to render on its own)
+        self.display1 = None  # Left eye display
+        self.display2 = None  # Right eye display
+        
+        # SPI writer frame slots (one per display) so transfers overlap with the next frame's render
+        self.spi_slot_left = FrameSlot()
+        self.spi_slot_right = FrameSlot()
+        self.spi_writers_running = False
+        self.spi_writer_threads = []  # Joined in close_displays() before the SPI handles close
+        
+        # Pre-rendered eye sprite caches for standalone rendering (RGB565 bytes,
+        # keyed by quantized position/blink inside create_eye_image)
+        self.eye_cache_left = {}
+        self.eye_cache_right = {}
+        self.sprite_cache_size = 256
+        self.blink_sprites = None  # Centered eye per blink level, pre-rendered in init_displays()
+        
+        # Last frame sent to each display (cached bytes objects, compared by identity)
+        self.last_sent_left = None
+        self.last_sent_right = None
         
         # Animation parameters
         self.orbit_radius = 80  # Large radius to move eyes near screen edge
+        
+        # Orbit offset lookup table - one full revolution (angle = t * 0.5 * pi, 4 s period)
+        # sampled at the 60 Hz display rate, so the orbit needs no trig per frame
+        self.orbit_lut_rate = 60  # Samples per second
+        orbit_period = 4.0
+        self.orbit_lut = self._build_orbit_lut(self.orbit_radius, 0.5 * math.pi / self.orbit_lut_rate,
+                                               int(orbit_period * self.orbit_lut_rate))
         self.scan_speed = 0.5
         self.blink_duration = 0.2
         self.sleep_duration = 3.0
         
         # State variables
-        self.last_blink_time = time.time()
+        self.last_blink_time = time.monotonic()
         self.blink_interval = random.uniform(2.0, 5.0)  # Random blink interval
         self.is_blinking = False
         self.blink_start_time = 0
@@ -41,11 +77,25 @@ class IdleAnimations:
         self.left_blink_state = 1.0
         self.right_blink_state = 1.0
         
+        # Animation 3 half (left/right), re-picked whenever an animation starts
+        self._animation3_offset_x = random.choice((-40, 40))
+        
         # Smoothing variables to reduce shaking
         self.left_target_pos = (WIDTH//2, HEIGHT//2)
         self.right_target_pos = (WIDTH//2, HEIGHT//2)
         self.movement_speed = 0.15  # Smooth movement speed for smoother animation
         
+        # Animation dispatch table - index matches current_animation / get_animation_name()
+        self.animation_funcs = [
+            self.animation_1_rolling_orbit,
+            self.animation_2_horizontal_scan,
+            self.animation_3_vertical_scan_random_x,
+            self.animation_4_blinking,
+            self.animation_5_hate_eyes,
+            self.animation_6_sleeping_eyes,
+            self.animation_7_arch_movement,
+        ]
+        
         # Frame skipping to prevent overlapping
         self.frame_skip_counter = 0
         self.frame_skip_interval = 1  # Update display every frame for smoother animation
@@ -83,9 +133,16 @@ class IdleAnimations:
         new_left_x = current_left_x + (target_left_x - current_left_x) * self.movement_speed
         new_left_y = current_left_y + (target_left_y - current_left_y) * self.movement_speed
         
+        # Both eyes share one target and position (all synchronized animations) - reuse the left result
+        shared = self.right_target_pos == self.left_target_pos and self.right_eye_pos == self.left_eye_pos
+        
         # Round to 1 decimal place to reduce floating point precision issues
         self.left_eye_pos = (round(new_left_x, 1), round(new_left_y, 1))
         
+        if shared:
+            self.right_eye_pos = self.left_eye_pos
+            return
+        
         # Smooth right eye movement
         current_right_x, current_right_y = self.right_eye_pos
         target_right_x, target_right_y = self.right_target_pos
@@ -96,30 +153,40 @@ class IdleAnimations:
         # Round to 1 decimal place to reduce floating point precision issues
         self.right_eye_pos = (round(new_right_x, 1), round(new_right_y, 1))
     
-    def animation_1_rolling_orbit(self, t):
-        """Rolling eyes around orbit - smooth circular motion"""
-        # Animation parameters
-        orbit_radius = 80  # Large radius to move eyes near screen edge
-        
-        # Simple smooth circular motion
-        angle = t * 0.5 * math.pi  # Slow, smooth rotation
-        
-        # Calculate position
-        offset_x = orbit_radius * math.cos(angle)
-        offset_y = orbit_radius * math.sin(angle)
-        
+    @staticmethod
+    def _build_orbit_lut(radius, step_angle, steps):
+        """Build orbit offsets by advancing a fixed rotation (one sin/cos pair for the whole table)"""
+        c, s = math.cos(step_angle), math.sin(step_angle)
+        x, y = float(radius), 0.0
+        lut = []
+        for _ in range(steps):
+            lut.append((x, y))
+            # Rotate (x, y) by step_angle: [[c, -s], [s, c]]
+            x, y = c * x - s * y, s * x + c * y
+        return lut
+    
+    def _set_shared_target(self, offset_x, offset_y):
+        """Apply one offset to the display center and share it between both eyes"""
+        # Both eyes use the same offset, so compute the position once
+        # No clamp needed - animation offsets stay within +/-100 px of center, and
+        # create_eye_image keeps the iris on screen anyway
         center_x, center_y = WIDTH//2, HEIGHT//2
-        left_x = center_x + offset_x
-        left_y = center_y + offset_y
-        right_x = center_x + offset_x
-        right_y = center_y + offset_y
+        target_x = center_x + offset_x
+        target_y = center_y + offset_y
         
         # Set target positions for smooth movement
-        self.left_target_pos = (left_x, left_y)
-        self.right_target_pos = (right_x, right_y)
+        self.left_target_pos = (target_x, target_y)
+        self.right_target_pos = self.left_target_pos
         
         return self.left_target_pos, self.right_target_pos
     
+    def animation_1_rolling_orbit(self, t):
+        """Rolling eyes around orbit - smooth circular motion"""
+        # Simple smooth circular motion - slow rotation looked up from the precomputed orbit
+        offset_x, offset_y = self.orbit_lut[int(t * self.orbit_lut_rate) % len(self.orbit_lut)]
+        
+        return self._set_shared_target(offset_x, offset_y)
+    
     def animation_2_horizontal_scan(self, t):
         """Horizontal scanning from edge to edge with holds"""
         # Edge-to-edge scanning with holds
@@ -148,17 +215,7 @@ class IdleAnimations:
             # Holding at left edge
             offset_x = -scan_range  # -80 (left edge)
         
-        center_x, center_y = WIDTH//2, HEIGHT//2
-        left_x = center_x + offset_x
-        left_y = center_y
-        right_x = center_x + offset_x
-        right_y = center_y
-        
-        # Set target positions for smooth movement
-        self.left_target_pos = (left_x, left_y)
-        self.right_target_pos = (right_x, right_y)
-        
-        return self.left_target_pos, self.right_target_pos
+        return self._set_shared_target(offset_x, 0)
     
     def animation_3_vertical_scan_random_x(self, t):
         """Vertical scanning: left or right half, 3 up-down cycles"""
@@ -180,23 +237,13 @@ class IdleAnimations:
             self.right_target_pos = (center_x, center_y)
             return self.left_target_pos, self.right_target_pos
         
-        # Pick left or right half (set once at start of animation)
-        if not hasattr(self, '_animation3_half'):
-            # Randomly choose left or right half
-            self._animation3_half = random.choice(['left', 'right'])
-        
-        # Set horizontal offset based on chosen half
-        if self._animation3_half == 'left':
-            offset_x = -40  # Left half of display
-        else:
-            offset_x = 40   # Right half of display
+        # Left or right half - picked once per animation start in _reset_animation_state()
+        offset_x = self._animation3_offset_x
         
         # Calculate which cycle we're in
         cycle_num = int(t / cycle_time)
         cycle_t = t % cycle_time
         
-        center_x, center_y = WIDTH//2, HEIGHT//2
-        
         if cycle_t < move_time:
             # Moving up
             progress = cycle_t / move_time
@@ -212,16 +259,7 @@ class IdleAnimations:
             # Holding at bottom
             offset_y = 0  # Center vertically
         
-        left_x = center_x + offset_x
-        left_y = center_y + offset_y
-        right_x = center_x + offset_x
-        right_y = center_y + offset_y
-        
-        # Set target positions for smooth movement
-        self.left_target_pos = (left_x, left_y)
-        self.right_target_pos = (right_x, right_y)
-        
-        return self.left_target_pos, self.right_target_pos
+        return self._set_shared_target(offset_x, offset_y)
     
     def animation_4_blinking(self, t):
         """Separate eye blinking: close right eye, then left eye, 2 cycles"""
@@ -294,7 +332,7 @@ class IdleAnimations:
         self.right_blink_state = right_blink_state
         
         # Debug output for blinking animation
-        if int(t * 10) != getattr(self, '_last_blink_debug', -1):
+        if self.debug and int(t * 10) != getattr(self, '_last_blink_debug', -1):
             self._last_blink_debug = int(t * 10)
             print(f"Blink animation: t={t:.2f}, Left={left_blink_state:.2f}, Right={right_blink_state:.2f}")
         
@@ -316,8 +354,6 @@ class IdleAnimations:
             self.right_target_pos = (center_x, center_y)
             return self.left_target_pos, self.right_target_pos
         
-        center_x, center_y = WIDTH//2, HEIGHT//2
-        
         if t < roll_duration:
             # Rolling up phase
             progress = t / roll_duration
@@ -334,16 +370,7 @@ class IdleAnimations:
             offset_y = -80  # Stay at top edge
             offset_x = 60   # Stay at right side edge
         
-        left_x = center_x + offset_x
-        left_y = center_y + offset_y
-        right_x = center_x + offset_x
-        right_y = center_y + offset_y
-        
-        # Set target positions for smooth movement
-        self.left_target_pos = (left_x, left_y)
-        self.right_target_pos = (right_x, right_y)
-        
-        return self.left_target_pos, self.right_target_pos
+        return self._set_shared_target(offset_x, offset_y)
     
     def animation_6_sleeping_eyes(self, t):
         """Slow closing eyes like sleeping"""
@@ -375,7 +402,7 @@ class IdleAnimations:
         self.right_blink_state = blink_state
         
         # Debug output for sleeping animation
-        if int(t * 5) != getattr(self, '_last_sleep_debug', -1):
+        if self.debug and int(t * 5) != getattr(self, '_last_sleep_debug', -1):
             self._last_sleep_debug = int(t * 5)
             print(f"Sleep animation: t={t:.2f}, Progress={sleep_progress:.2f}, Blink={blink_state:.2f}")
         
@@ -404,8 +431,6 @@ class IdleAnimations:
             self.right_target_pos = (center_x, center_y)
             return self.left_target_pos, self.right_target_pos
         
-        center_x, center_y = WIDTH//2, HEIGHT//2
-        
         if t < total_arch_time:
             # Calculate which cycle and phase we're in
             cycle_t = t % cycle_time
@@ -436,16 +461,7 @@ class IdleAnimations:
             offset_x = -arch_radius * (1 - return_progress)  # Current position to 0
             offset_y = 0  # Stay at center vertically
         
-        left_x = center_x + offset_x
-        left_y = center_y + offset_y
-        right_x = center_x + offset_x
-        right_y = center_y + offset_y
-        
-        # Set target positions for smooth movement
-        self.left_target_pos = (left_x, left_y)
-        self.right_target_pos = (right_x, right_y)
-        
-        return self.left_target_pos, self.right_target_pos
+        return self._set_shared_target(offset_x, offset_y)
     
     def should_blink(self, current_time):
         """Check if eyes should blink"""
@@ -470,12 +486,103 @@ class IdleAnimations:
         self.is_blinking = True
         self.blink_start_time = current_time
     
-    # render_eyes method removed - main system handles rendering
+    def init_displays(self):
+        """Initialize both displays for the standalone animation test"""
+        try:
+            self.display1 = GC9A01(
+                spi_bus=0, spi_device=0,
+                cs_pin=DISPLAY1_CS_PIN,
+                dc_pin=DISPLAY1_DC_PIN,
+                rst_pin=DISPLAY1_RST_PIN
+            )
+            self.display2 = GC9A01(
+                spi_bus=0, spi_device=1,
+                cs_pin=DISPLAY2_CS_PIN,
+                dc_pin=DISPLAY2_DC_PIN,
+                rst_pin=DISPLAY2_RST_PIN
+            )
+            print("Test displays initialized successfully!")
+            
+            # Pre-render the centered eye at every blink level (create_eye_image caches blink in 0.1 steps)
+            # - blinking and sleeping animations keep the eyes centered, so they never rasterize
+            self.blink_sprites = {
+                level / 10: create_eye_image(WIDTH//2, HEIGHT//2, level / 10, eye_color=self.eye_color)
+                for level in range(11)
+            }
+            
+            # Start one SPI writer thread per display
+            self.spi_writers_running = True
+            self.spi_writer_threads = [
+                threading.Thread(target=self._spi_writer_loop, args=(self.display1, self.spi_slot_left), daemon=True),
+                threading.Thread(target=self._spi_writer_loop, args=(self.display2, self.spi_slot_right), daemon=True)
+            ]
+            for thread in self.spi_writer_threads:
+                thread.start()
+            return True
+        except Exception as e:
+            print(f"Failed to initialize test displays: {e}")
+            return False
+    
+    def close_displays(self):
+        """Close displays opened by init_displays()"""
+        self.spi_writers_running = False
+        # Wait for the writers to leave send_to_display (their slot wait times out after 0.1 s)
+        # - closing a display under a transfer in progress would pull the spidev handle away
+        for thread in self.spi_writer_threads:
+            thread.join()
+        self.spi_writer_threads = []
+        if self.display1:
+            self.display1.close()
+        if self.display2:
+            self.display2.close()
+    
+    def render_eyes(self, left_pos, right_pos, blink_state=False):
+        """Render both eyes to the test displays (main system does its own rendering)"""
+        if not self.display1 or not self.display2:
+            return
+        
+        # Regular blink closes both eyes, otherwise use per-eye states (blinking/sleeping animations)
+        left_blink_value = 0.0 if blink_state else self.left_blink_state
+        right_blink_value = 0.0 if blink_state else self.right_blink_state
+        
+        # Cached sprites - hold phases of the animations hit the cache nearly every frame
+        rgb565_bytes_left = self._get_eye_sprite(left_pos, left_blink_value, self.eye_cache_left)
+        rgb565_bytes_right = self._get_eye_sprite(right_pos, right_blink_value, self.eye_cache_right)
+        
+        # Hand frames to the SPI writer threads - render of the next frame overlaps the transfer
+        # Sprites come from caches, so an unchanged frame is the very same bytes object - skip it
+        if rgb565_bytes_left is not self.last_sent_left:
+            self.spi_slot_left.put(rgb565_bytes_left)
+            self.last_sent_left = rgb565_bytes_left
+        if rgb565_bytes_right is not self.last_sent_right:
+            self.spi_slot_right.put(rgb565_bytes_right)
+            self.last_sent_right = rgb565_bytes_right
+    
+    def _get_eye_sprite(self, pos, blink_value, eye_cache):
+        """Get RGB565 bytes for one eye - pre-rendered blink sprite when centered, else cached render"""
+        eye_x, eye_y = pos
+        # Same 5 px position quantization as the create_eye_image cache key
+        if self.blink_sprites and round(eye_x / 5) * 5 == WIDTH//2 and round(eye_y / 5) * 5 == HEIGHT//2:
+            return self.blink_sprites[round(blink_value * 10) / 10]
+        return create_eye_image(eye_x, eye_y, blink_value, eye_cache, self.sprite_cache_size, self.eye_color)
+    
+    def _spi_writer_loop(self, display, spi_slot):
+        """SPI writer thread - streams queued frames to one display"""
+        while self.spi_writers_running:
+            rgb565_bytes = spi_slot.get(timeout=0.1)
+            if rgb565_bytes is None:
+                continue
+            
+            try:
+                send_to_display(display, rgb565_bytes)
+            except Exception as e:
+                print(f"SPI writer error: {e}")
+                time.sleep(0.1)
     
     def start_random_animation(self):
         """Start a random animation"""
-        self.current_animation = random.randint(0, 6)  # 0-6 for 7 animations
-        self.animation_start_time = time.time()
+        self.current_animation = random.randrange(len(self.animation_funcs))
+        self.animation_start_time = time.monotonic()
         
         # Reset animation-specific state variables
         self._reset_animation_state()
@@ -489,8 +596,8 @@ class IdleAnimations:
         self.right_blink_state = 1.0
         
         # Reset animation-specific variables
-        if hasattr(self, '_animation3_half'):
-            delattr(self, '_animation3_half')
+        # Animation 3: randomly choose left (-40) or right (+40) half of display
+        self._animation3_offset_x = random.choice((-40, 40))
         
         # Reset debug counters
         if hasattr(self, '_last_blink_debug'):
@@ -500,7 +607,7 @@ class IdleAnimations:
     
     def update(self):
         """Update the current animation"""
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed_time = current_time - self.animation_start_time
         
         # Get animation positions
@@ -514,8 +621,8 @@ class IdleAnimations:
         self.smooth_eye_movement()
         
         # Debug: print positions occasionally
-        if int(time.time()) != getattr(self, '_last_anim_debug', -1):
-            self._last_anim_debug = int(time.time())
+        if self.debug and int(current_time) != getattr(self, '_last_anim_debug', -1):
+            self._last_anim_debug = int(current_time)
             anim_name = self.get_animation_name(self.current_animation)
             print(f"Animation {self.current_animation + 1} ({anim_name}) positions: Left={self.left_eye_pos}, Right={self.right_eye_pos}")
         
@@ -532,84 +639,62 @@ class IdleAnimations:
             self.left_blink_state = 1.0
             self.right_blink_state = 1.0
         
-        if self.current_animation == 0:
-            return self.animation_1_rolling_orbit(t)
-        elif self.current_animation == 1:
-            return self.animation_2_horizontal_scan(t)
-        elif self.current_animation == 2:
-            return self.animation_3_vertical_scan_random_x(t)
-        elif self.current_animation == 3:
-            return self.animation_4_blinking(t)
-        elif self.current_animation == 4:
-            return self.animation_5_hate_eyes(t)
-        elif self.current_animation == 5:
-            return self.animation_6_sleeping_eyes(t)
-        elif self.current_animation == 6:
-            return self.animation_7_arch_movement(t)
-        else:
-            return self.animation_1_rolling_orbit(t)
+        return self.animation_funcs[self.current_animation](t)
     
     def run_animation_test(self):
         """Run the animation test"""
+        frame_interval = 1.0/20.0  # 20 FPS (reduced to prevent overlapping)
+        next_frame_time = time.monotonic()
         try:
             while True:
-                current_time = time.time()
-                animation_time = current_time - self.animation_start_time
+                # One clock read per frame, shared by everything below
+                now = time.monotonic()
+                animation_time = now - self.animation_start_time
                 
                 # Switch animation every 10 seconds
                 if animation_time > self.animation_duration:
-                    self.animation_start_time = current_time
-                    self.current_animation = (self.current_animation + 1) % 7
+                    self.animation_start_time = now
+                    self.current_animation = (self.current_animation + 1) % len(self.animation_funcs)
                     animation_time = 0
+                    self._reset_animation_state()
                     print(f"\n--- Switching to Animation {self.current_animation + 1}: {self.get_animation_name(self.current_animation)} ---")
                 
                 # Get eye positions based on current animation
-                if self.current_animation == 0:
-                    left_pos, right_pos = self.animation_1_rolling_orbit(animation_time)
-                elif self.current_animation == 1:
-                    left_pos, right_pos = self.animation_2_horizontal_scan(animation_time)
-                elif self.current_animation == 2:
-                    left_pos, right_pos = self.animation_3_vertical_scan_random_x(animation_time)
-                elif self.current_animation == 3:
-                    left_pos, right_pos = self.animation_4_blinking(animation_time)
-                elif self.current_animation == 4:
-                    left_pos, right_pos = self.animation_5_hate_eyes(animation_time)
-                elif self.current_animation == 5:
-                    left_pos, right_pos = self.animation_6_sleeping_eyes(animation_time)
-                elif self.current_animation == 6:
-                    left_pos, right_pos = self.animation_7_arch_movement(animation_time)
+                left_pos, right_pos = self.animation_funcs[self.current_animation](animation_time)
                 
                 # Smooth eye movement to reduce shaking
                 self.smooth_eye_movement()
                 
                 # Debug: print positions occasionally
-                if int(time.time()) != getattr(self, '_last_pos_debug', -1):
-                    self._last_pos_debug = int(time.time())
+                if self.debug and int(now) != getattr(self, '_last_pos_debug', -1):
+                    self._last_pos_debug = int(now)
                     print(f"Left eye: {self.left_eye_pos}, Right eye: {self.right_eye_pos}")
                 
                 # Handle blinking (except during blinking animation)
                 blink_state = False
                 if self.current_animation != 3:  # Not during blinking animation
-                    if self.should_blink(current_time):
-                        self.start_blink(current_time)
-                    blink_state = self.get_blink_state(current_time)
-                
-                # Handle sleep state
-                sleep_state = False
-                if self.current_animation == 5:  # Sleeping eyes
-                    sleep_progress = min(animation_time / self.sleep_duration, 1.0)
-                    sleep_state = sleep_progress > 0.5  # Start closing halfway through
+                    if self.should_blink(now):
+                        self.start_blink(now)
+                    blink_state = self.get_blink_state(now)
                 
                 # Render eyes using smoothed positions
-                self.render_eyes(self.left_eye_pos, self.right_eye_pos, blink_state, sleep_state)
+                # (sleeping/blinking animations drive left/right_blink_state directly)
+                self.render_eyes(self.left_eye_pos, self.right_eye_pos, blink_state)
                 
-                # Print status every second
-                if int(animation_time) != getattr(self, '_last_print_second', -1):
+                # Print status every second (debug only)
+                if self.debug and int(animation_time) != getattr(self, '_last_print_second', -1):
                     self._last_print_second = int(animation_time)
                     remaining = self.animation_duration - animation_time
                     print(f"Animation {self.current_animation + 1}: {self.get_animation_name(self.current_animation)} - {remaining:.1f}s remaining")
                 
-                time.sleep(1.0/20.0)  # 20 FPS (reduced to prevent overlapping)
+                # Sleep until the next frame deadline (drift-corrected, so slow frames don't lower FPS)
+                next_frame_time += frame_interval
+                sleep_time = next_frame_time - time.monotonic()
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
+                else:
+                    # Overran the deadline - restart the cadence instead of bursting to catch up
+                    next_frame_time = time.monotonic()
                 
         except KeyboardInterrupt:
             print("\nAnimation test stopped by user")
@@ -622,9 +707,14 @@ def main():
     
     # Initialize animations
     animations = IdleAnimations()
+    if not animations.init_displays():
+        return
     
     # Run the test
-    animations.run_animation_test()
+    try:
+        animations.run_animation_test()
+    finally:
+        animations.close_displays()
     
     print("Animation test completed!")
 
@@ -41,6 +41,15 @@ pip3 install picamera2 pillow numpy opencv-python
 echo "Enabling SPI interface..."
 sudo raspi-config nonint do_spi 0
 
+# Raise the spidev buffer so a full 240x240 RGB565 frame (115200 bytes) goes out in one SPI write
+echo "Raising spidev buffer size..."
+CMDLINE=/boot/firmware/cmdline.txt
+[ -f "$CMDLINE" ] || CMDLINE=/boot/cmdline.txt
+if ! grep -q "spidev.bufsiz" "$CMDLINE"; then
+    sudo sed -i '1 s/$/ spidev.bufsiz=131072/' "$CMDLINE"
+    echo "Added spidev.bufsiz=131072 to $CMDLINE"
+fi
+
 # Enable GPIO interface
 echo "Enabling GPIO interface..."
 sudo raspi-config nonint do_gpio 0
@@ -1,18 +1,18 @@
-from picamera2 import Picamera2
+from picamera2 import Picamera2, MappedArray
 import cv2
 import numpy as np
 import sys
 import os
 import time
 import threading
-import queue
 import argparse
+from collections import deque
 
 # Import display settings and driver
 from display_settings import (
     GC9A01, DISPLAY1_CS_PIN, DISPLAY1_DC_PIN, DISPLAY1_RST_PIN,
     DISPLAY2_CS_PIN, DISPLAY2_DC_PIN, DISPLAY2_RST_PIN,
-    WIDTH, HEIGHT, send_to_display
+    WIDTH, HEIGHT, send_to_display, FrameSlot
 )
 
 # Import eye template
@@ -21,12 +21,20 @@ from eye_template import create_eye_image, preview_eyes, get_eye_colors, EYE_CON
 # Import idle animations
 from idle_animations import IdleAnimations
 
+# Make sure OpenCV uses its NEON-optimized code paths
+cv2.setUseOptimized(True)
+# No OpenCV worker pool - the hot threads are pinned to their own cores, so pool workers would
+# only time-slice on the caller's core (or land on the display core), and fork/join costs more
+# than the kernels themselves on the small detection images
+cv2.setNumThreads(1)
+
 class EyeTracker:
     def __init__(self, enable_preview=True):
         self.display1 = None  # Left eye display
         self.display2 = None  # Right eye display
         self.camera = None
-        self.face_cascade = None
+        self.face_cascade = None  # Single classifier instance, loaded once in init_face_detection
+        self._face_gray = None  # Contrast-equalized copy for the face classifier
         self.running = False
         self.enable_preview = enable_preview  # NEW: Control preview window
         
@@ -41,12 +49,13 @@ class EyeTracker:
         self.current_right_eye = (WIDTH//2, HEIGHT//2)
         self.eye_movement_speed = 0.08  # Much slower, smoother movement to reduce shaking
         self.eye_movement_speed_slow = 0.04  # 2x slower for smooth transition from face-following to normal
+        self.eye_snap_distance = 0.5  # Eyes snap onto their target once closer than this (px)
         self.last_motion_time = time.time()
         self.motion_timeout = 2.0  # Return to center after 2 seconds of no motion
         
         # Motion smoothing to reduce shaking
-        self.motion_history = []
         self.motion_history_size = 5  # Average last 5 positions for smoother motion
+        self.motion_history = deque(maxlen=self.motion_history_size)
         
         # Blinking (more natural timing)
         self.is_blinking = False
@@ -55,6 +64,11 @@ class EyeTracker:
         self.last_blink_time = time.time()
         self.next_blink_delay = np.random.uniform(3, 8)  # Random blink every 3-8 seconds (more realistic)
         
+        # Display thread pacing - 60 FPS while animating, parked on eye_update_event once at rest
+        self.display_frame_interval = 1.0/60.0
+        self.display_rest_timeout = 0.1  # Longest park - picks up color/pupil changes without an event
+        self.eye_update_event = threading.Event()  # Set when the camera thread gives the eyes something to do
+        
         # Separate blink states for idle animations
         self.left_blink_state = 1.0  # 1.0 = open, 0.0 = closed
         self.right_blink_state = 1.0  # 1.0 = open, 0.0 = closed
@@ -75,8 +89,27 @@ class EyeTracker:
         self.timing_spi_total = []
         
         # Threading
-        self.frame_queue = queue.Queue(maxsize=1) if enable_preview else None
+        # Latest preview frame only - appending to a maxlen=1 deque atomically replaces the old one
+        self.frame_queue = deque(maxlen=1) if enable_preview else None
+        self.preview_interval = 0.1  # Preview is throttled to 10 FPS - it is only for watching
+        self.last_preview_time = 0
         self.display_thread = None
+        self._camera_thread = None  # Worker threads - joined in stop() before their devices close
+        self._spi_threads = []
+        self.thread_join_timeout = 1.0  # Seconds stop() waits for each worker to finish its current frame
+        
+        # CPU cores for the hot threads (Pi 5 has 4 cores) - keeps caches warm and pacing steady
+        self.preview_core = 1
+        self.camera_core = 2
+        self.display_core = 3
+        # SPI writers go next to the (throttled, optional) preview - never onto the display core, where
+        # the SCHED_FIFO display thread would preempt them whenever it is runnable
+        self.spi_core = 1
+        self.display_rt_priority = 20  # SCHED_FIFO priority for the display thread (needs root / CAP_SYS_NICE)
+        
+        # SPI writer frame slots (one per display) - next frame renders while the last one transmits
+        self.spi_slot_left = FrameSlot()
+        self.spi_slot_right = FrameSlot()
         
         # Face detection for color changes only - Pi 5 optimized
         self.face_detection_counter = 0
@@ -93,6 +126,8 @@ class EyeTracker:
         self.last_motion_time = time.time()  # Track last motion for interruption
         self.transitioning_from_face_following = False  # Flag for smooth transition
         self.face_following_exit_time = 0  # Time when face-following mode was exited
+        self._last_face_following_debug = -1  # Second of the last face-following/idle debug print
+        self._last_idle_debug = -1
         
         # Idle animation system
         self.idle_animations = None
@@ -101,10 +136,11 @@ class EyeTracker:
         self.idle_trigger_delay = np.random.uniform(10, 30)  # 5-10 seconds for testing
         self.idle_resume_delay = np.random.uniform(20, 40)  # 5-10 seconds delay before resuming
         self.idle_animation_started = False
+        self.idle_frame_interval = 0.2  # Camera samples at 5 FPS while idle - only needs to notice motion
         
         # Dynamic pupil sizing based on face size with smooth animation
-        self.face_sizes = []  # Store last 5 face sizes
         self.max_face_history = 5
+        self.face_sizes = deque(maxlen=self.max_face_history)  # Store last 5 face sizes
         self.min_face_size = 100 * 100  # 50x50 pixels (2500 area)
         self.max_face_size = 240 * 240  # 240x240 pixels (57600 area)
         self.current_pupil_size_index = 15  # Current pupil size index (middle)
@@ -114,12 +150,31 @@ class EyeTracker:
         self.pupil_size_transition_speed = 0.01  # How fast pupil size changes
         
         # Motion detection variables - Pi 5 optimized
-        self.prev_frame = None
+        self.motion_background = None  # Running average of recent frames (float32)
+        self.motion_background_rate = 0.05  # How fast the background adapts (per frame)
+        self._motion_background_u8 = None  # Preallocated buffers for detect_motion
+        self._motion_gray = None
+        self._motion_delta = None  # Difference, thresholded in place into the motion mask
         self.motion_threshold = 25  # Lower threshold for higher resolution
         self.min_motion_area = 200  # Larger minimum area for higher resolution
+        self.motion_stride = 2  # Motion runs on every 2nd row/column of the detection frame
         # Pi 5 optimized resolution - higher resolution for better detection
         self.camera_width = 800
         self.camera_height = 600 
+        # Detection runs on the camera's downscaled lores stream (1/4 of the pixels, scaled by the ISP),
+        # motion on a further motion_stride decimation of it - boxes are scaled back to camera coordinates
+        self.detection_scale = 2
+        self.detect_width = self.camera_width // self.detection_scale
+        self.detect_height = self.camera_height // self.detection_scale
+        
+        # Camera -> display mapping folded into one multiply-add per axis
+        # (normalize to -1..1 around the camera center, scale to the eye range, X inverted)
+        eye_range_x = WIDTH//2 - 20
+        eye_range_y = HEIGHT//2 - 20
+        self._eye_gain_x = -eye_range_x / (self.camera_width//2)
+        self._eye_offset_x = WIDTH//2 + eye_range_x
+        self._eye_gain_y = eye_range_y / (self.camera_height//2)
+        self._eye_offset_y = HEIGHT//2 - eye_range_y
         
         # Eye color system - get colors from eye template
         eye_colors = get_eye_colors()
@@ -129,24 +184,20 @@ class EyeTracker:
         self.color_transition_speed = 0.05  # How fast colors change
         self.target_eye_color = self.base_eye_color.copy()
         
-        # Pre-rendered eye cache (optimization #1) - separate for each eye
-        self.eye_cache_left = {}
-        self.eye_cache_right = {}
-        self.cache_size = 100  # Cache 50 eye positions (more aggressive)
+        # Last rendered (rounded position, blink) per eye - a single-slot cache: frames are only
+        # rendered when it changes. The smoothed positions never repeat, so a frame cache
+        # keyed by position almost never hit and just held ~100 x 115 KB of RGB565 per eye
         self.last_rendered_pos_left = None
         self.last_rendered_pos_right = None
+        self.last_blink_state = 1.0  # Blink states of the last render (to spot blink changes)
+        self.last_left_blink_state = 1.0
+        self.last_right_blink_state = 1.0
         
-        # Frame skipping (optimization #3)
-        self.display_update_counter = 0
-        self.display_update_interval = 2  # Update display every 2 frames
-        
-        # Motion detection optimization (optimization #5)
+        # Motion detection optimization (optimization #5) - adaptive frame skipping
         self.motion_check_counter = 0
-        self.motion_check_interval = 2  # Check every 2nd frame (15-20 Hz detection)
-        
-        # Frame skipping for camera (optimization #3)
-        self.frame_skip_counter = 0
-        self.frame_skip_interval = 1  # Skip every 2nd frame capture
+        self.motion_check_interval = 1  # Current interval - every frame while things move
+        self.motion_check_interval_quiet = 4  # Check every 4th frame once the scene is still
+        self.motion_quiet_time = 3.0  # Seconds without motion before checking less often
         
     def init_display(self):
         """Initialize both GC9A01 displays"""
@@ -175,6 +226,11 @@ class EyeTracker:
             
             print("Both GC9A01 displays initialized successfully!")
             
+            # Pre-render the idle and face-tracked eye sprites so steady-state frames are pure blits
+            for eye_color, face_tracked in ((self.base_eye_color, False), (self.face_eye_color, True)):
+                create_eye_image(WIDTH//2, HEIGHT//2, 1.0, None, eye_color=eye_color,
+                                 iris_radius=EYE_CONFIG['iris_radius'], face_tracked=face_tracked)
+            
             # Initialize idle animations
             print("Initializing idle animations...")
             self.idle_animations = IdleAnimations()
@@ -190,16 +246,10 @@ class EyeTracker:
     def _test_displays(self):
         """Test both displays with a simple pattern"""
         try:
-            # Create a simple test pattern
-            test_image = np.zeros((WIDTH, HEIGHT, 3), dtype=np.uint8)
-            test_image[:, :] = [255, 0, 0]  # Red background
-            
-            # Convert to RGB565
-            r = (test_image[:, :, 0] >> 3).astype(np.uint16)
-            g = (test_image[:, :, 1] >> 2).astype(np.uint16)
-            b = (test_image[:, :, 2] >> 3).astype(np.uint16)
-            rgb565_full = (r << 11) | (g << 5) | b
-            rgb565_bytes = rgb565_full.astype('>u2').tobytes()
+            # Create a simple test pattern - solid red, filled straight in big-endian RGB565
+            # (no RGB888 image or per-channel conversion temporaries)
+            red_rgb565 = (255 >> 3) << 11
+            rgb565_bytes = np.full((HEIGHT, WIDTH), red_rgb565, dtype='>u2').tobytes()
             
             # Send to both displays
             print("Sending test pattern to Display 1...")
@@ -223,16 +273,22 @@ class EyeTracker:
             self.camera = Picamera2()
             
             # Pi 5 optimized configuration - higher resolution and better performance
+            # YUV420 frames come back as a single 2D (1.5*H, W) array: Y plane rows first, then U and V
             config = self.camera.create_video_configuration(
                 main={"size": (self.camera_width, self.camera_height), "format": "YUV420"},
-                # Add buffer configuration for Pi 5
-                buffer_count=4,  # More buffers for smoother operation
-                queue=True       # Enable frame queue for better performance
+                # Detection-size stream downscaled by the ISP in hardware - motion and face detection
+                # read its Y plane directly, so no resize runs on the CPU (main only feeds the preview)
+                lores={"size": (self.detect_width, self.detect_height), "format": "YUV420"},
+                # Few buffers and no queued frame - capture_request always waits for the newest
+                # frame instead of handing back one that sat in the queue (lower latency)
+                buffer_count=3,  # One held by detection, one being filled, one spare
+                queue=False
             )
             self.camera.configure(config)
             
             self.camera.start()
-            print(f"Camera: {self.camera_width}x{self.camera_height} (YUV420, Pi 5 optimized)")
+            print(f"Camera: {self.camera_width}x{self.camera_height} (YUV420, Pi 5 optimized), "
+                  f"detection stream {self.detect_width}x{self.detect_height}")
             print(f"Sensor resolution: {self.camera.sensor_resolution}")
             return True
         except Exception as e:
@@ -244,7 +300,11 @@ class EyeTracker:
         try:
             # Load Haar cascade for face detection
             # Try multiple possible locations
+            # LBP cascades first - integer pixel-comparison features, several times faster than Haar on the Pi
             cascade_paths = [
+                '/usr/share/opencv4/lbpcascades/lbpcascade_frontalface_improved.xml',
+                '/usr/local/share/opencv4/lbpcascades/lbpcascade_frontalface_improved.xml',
+                '/usr/share/opencv4/lbpcascades/lbpcascade_frontalface.xml',
                 '/usr/share/opencv4/haarcascades/haarcascade_frontalface_default.xml',
                 '/usr/local/share/opencv4/haarcascades/haarcascade_frontalface_default.xml',
                 '/usr/share/opencv/haarcascades/haarcascade_frontalface_default.xml',
@@ -256,7 +316,7 @@ class EyeTracker:
             for path in cascade_paths:
                 if os.path.exists(path):
                     cascade_path = path
-                break
+                    break
                 
             if cascade_path is None:
                 print("Haar cascade file not found. Downloading...")
@@ -276,37 +336,49 @@ class EyeTracker:
             if self.face_cascade.empty():
                 print("Failed to load face cascade")
                 return False
+            
+            # Warm up the cascade on a blank frame so its lazy setup isn't paid on the first real frame
+            self.face_cascade.detectMultiScale(np.zeros((self.detect_height, self.detect_width), dtype=np.uint8))
+            
+            # Scratch buffer for the equalized frame - allocated once, reused every detection
+            self._face_gray = np.empty((self.detect_height, self.detect_width), dtype=np.uint8)
+            
             print(f"Face detection initialized successfully using: {cascade_path}")
             return True
         except Exception as e:
             print(f"Failed to initialize face detection: {e}")
             return False
     
-    def create_eye_image(self, eye_x, eye_y, blink_state=1.0, eye_cache=None):
+    def create_eye_image(self, eye_x, eye_y, blink_state=1.0):
         """Create eye image with blinking support + RGB565 pre-conversion + dynamic sizing"""
         current_pupil_size_factor = self.get_current_pupil_size_factor()
-        return create_eye_image(eye_x, eye_y, blink_state, eye_cache, self.cache_size, self.current_eye_color, EYE_CONFIG['iris_radius'], self.face_detected, current_pupil_size_factor)
+        # Uncached - the eye sprite is cached, so a render is just a blit into a fresh buffer
+        return create_eye_image(eye_x, eye_y, blink_state, eye_color=self.current_eye_color,
+                                iris_radius=EYE_CONFIG['iris_radius'], face_tracked=self.face_detected,
+                                pupil_size_factor=current_pupil_size_factor)
     
     def detect_face(self, frame):
         """Detect faces in the frame"""
         if self.face_cascade is None:
             return []
         
-        # Convert frame to grayscale for face detection
-        if len(frame.shape) == 3:
-            gray = cv2.cvtColor(frame, cv2.COLOR_YUV2GRAY)
-        else:
-            gray = frame
+        # frame is the lores Y plane (a view of the camera buffer). Equalize into our own
+        # buffer - evens out dim/uneven lighting so the classifier needs fewer scales and neighbors
+        gray = cv2.equalizeHist(frame, dst=self._face_gray)
         
-        # Detect faces
+        # Detect faces (minimum size in full-resolution pixels, like the scaled-back boxes)
         faces = self.face_cascade.detectMultiScale(
             gray,
-            scaleFactor=1.1,
-            minNeighbors=5,
-            minSize=(30, 30),
+            scaleFactor=1.3,
+            minNeighbors=4,
+            minSize=(30 // self.detection_scale, 30 // self.detection_scale),
             flags=cv2.CASCADE_SCALE_IMAGE
         )
         
+        # Scale boxes back to camera coordinates
+        if len(faces) > 0:
+            faces = faces * self.detection_scale
+        
         return faces
     
     def update_face_detection(self, faces):
@@ -354,7 +426,8 @@ class EyeTracker:
         """Update face-following mode for eye positioning"""
         if len(faces) > 0:
             # Use the largest face (most prominent)
-            largest_face = max(faces, key=lambda f: f[2] * f[3])
+            areas = faces[:, 2].astype(np.int32) * faces[:, 3]
+            largest_face = faces[int(areas.argmax())]
             x, y, w, h = largest_face
             
             # Calculate face center
@@ -380,33 +453,26 @@ class EyeTracker:
             return (WIDTH//2, HEIGHT//2)
         
         face_x, face_y = face_center
-        
-        # Normalize face position (-1 to 1)
-        norm_x = (face_x - self.camera_width//2) / (self.camera_width//2)
-        norm_y = (face_y - self.camera_height//2) / (self.camera_height//2)
-        
-        # Map to display coordinates
-        eye_x = WIDTH//2 - norm_x * (WIDTH//2 - 20)  # Inverted X
-        eye_y = HEIGHT//2 + norm_y * (HEIGHT//2 - 20)  # Normal Y
-        
-        return (eye_x, eye_y)
+        return self.camera_to_eye_position(face_x, face_y)
+    
+    def camera_to_eye_position(self, camera_x, camera_y):
+        """Map a camera pixel to display coordinates (inverted X, normal Y)"""
+        return (self._eye_offset_x + camera_x * self._eye_gain_x,
+                self._eye_offset_y + camera_y * self._eye_gain_y)
     
     def update_face_size(self, faces):
         """Update face size history and calculate pupil size"""
         if len(faces) > 0:
             # Use the largest face (most prominent)
-            largest_face = max(faces, key=lambda f: f[2] * f[3])
+            areas = faces[:, 2].astype(np.int32) * faces[:, 3]
+            largest_face = faces[int(areas.argmax())]
             x, y, w, h = largest_face
             face_area = w * h
             
-            # Add to history
+            # Add to history - the deque drops anything older than the last 5
             self.face_sizes.append(face_area)
             
-            # Keep only last 5
-            if len(self.face_sizes) > self.max_face_history:
-                self.face_sizes.pop(0)
-            
-            # Calculate average face size
+            # Calculate average face size (plain sum/len - five ints don't need NumPy)
             if len(self.face_sizes) > 0:
                 avg_face_size = sum(self.face_sizes) / len(self.face_sizes)
                 
@@ -453,43 +519,66 @@ class EyeTracker:
         # Smooth color transition
         for i in range(3):  # RGB
             diff = self.target_eye_color[i] - self.current_eye_color[i]
+            if abs(diff) < 1.0:
+                # Snap the last sub-level step - otherwise the color creeps toward the target
+                # forever and every frame is a new look (new sprite, no cache hits)
+                self.current_eye_color[i] = self.target_eye_color[i]
+                continue
             self.current_eye_color[i] += diff * self.color_transition_speed
             
             # Ensure values stay within valid range
             self.current_eye_color[i] = max(0, min(255, self.current_eye_color[i]))
     
     def detect_motion(self, frame):
-        """Detect motion in the frame using frame difference"""
-        # Extract Y channel from YUV420 (already grayscale!)
-        if len(frame.shape) == 3:
-            # YUV420 - extract Y channel (grayscale)
-            gray = frame[:, :, 0]  # Y channel is first
-        else:
-            # Already grayscale
-            gray = frame
+        """Detect motion in the frame by differencing against a running-average background"""
+        # Motion only needs a rough location - decimate the lores Y plane (already detection size)
+        # straight to the motion grid, only the kept pixels are ever read
+        gray = frame[::self.motion_stride, ::self.motion_stride]
+        scale = self.detection_scale * self.motion_stride
+        
+        # Initialize the background from the first frame plus the difference buffers,
+        # so no image is allocated per frame afterwards
+        if self.motion_background is None:
+            self.motion_background = gray.astype(np.float32)
+            self._motion_background_u8 = gray.copy()
+            self._motion_gray = gray.copy()
+            self._motion_delta = np.empty_like(self._motion_gray)
+            return []
         
-        # Initialize previous frame
-        if self.prev_frame is None:
-            self.prev_frame = gray
+        # Subsampled view into our own contiguous buffer (OpenCV would otherwise copy it itself)
+        np.copyto(self._motion_gray, gray)
+        gray = self._motion_gray
+        
+        # Difference against the background - a running average shrugs off single-frame
+        # sensor noise and exposure wobble that a plain previous-frame delta picks up
+        cv2.convertScaleAbs(self.motion_background, dst=self._motion_background_u8)
+        # Threshold in place - the mask reuses the difference buffer, so both passes stay
+        # on one cache-resident image
+        cv2.absdiff(self._motion_background_u8, gray, dst=self._motion_delta)
+        cv2.threshold(self._motion_delta, self.motion_threshold, 255, cv2.THRESH_BINARY, dst=self._motion_delta)
+        motion_mask = self._motion_delta
+        
+        # Blend the new frame into the background in place
+        cv2.accumulateWeighted(gray, self.motion_background, self.motion_background_rate)
+        
+        # Quiet frame - too few changed pixels in total for any blob to pass the area filter,
+        # so skip labeling (min_motion_area is in full-resolution pixels)
+        if cv2.countNonZero(motion_mask) * (scale ** 2) <= self.min_motion_area:
             return []
         
-        # Calculate frame difference
-        frame_delta = cv2.absdiff(self.prev_frame, gray)
-        _, thresh = cv2.threshold(frame_delta, self.motion_threshold, 255, cv2.THRESH_BINARY)
+        # Find motion blobs - one labeling pass gives every bounding box and area at once
+        # (16-bit labels - the motion grid has far fewer than 65535 pixels)
+        num_labels, _, stats, _ = cv2.connectedComponentsWithStats(motion_mask, connectivity=8, ltype=cv2.CV_16U)
         
-        # Update previous frame
-        self.prev_frame = gray
+        # Filter blobs by area (label 0 is the background)
+        stats = stats[1:num_labels]
+        stats = stats[stats[:, cv2.CC_STAT_AREA] * (scale ** 2) > self.min_motion_area]
         
-        # Find contours
-        contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # Largest blob first (by changed-pixel count), so callers just take motion_boxes[0]
+        stats = stats[np.argsort(-stats[:, cv2.CC_STAT_AREA], kind='stable')]
         
-        # Filter contours by area
-        motion_boxes = []
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area > self.min_motion_area:
-                x, y, w, h = cv2.boundingRect(contour)
-                motion_boxes.append((x, y, w, h))
+        # Scale boxes back to camera coordinates
+        motion_boxes = [tuple(box) for box in (stats[:, :4] * scale).tolist()]
         
         return motion_boxes
     
@@ -533,78 +622,67 @@ class EyeTracker:
             # Face-following mode - use face position
             eye_x, eye_y = self.get_eye_position_from_face(self.current_face_center)
             # Debug: Print occasionally when in face-following mode
-            if int(time.time()) != getattr(self, '_last_face_following_debug', -1):
+            if int(time.time()) != self._last_face_following_debug:
                 self._last_face_following_debug = int(time.time())
                 print(f"Face-following mode: Eyes tracking face at ({eye_x:.0f}, {eye_y:.0f})")
             
-            # Add to motion history for smoothing
-            self.motion_history.append((eye_x, eye_y))
-            if len(self.motion_history) > self.motion_history_size:
-                self.motion_history.pop(0)
-            
-            # Calculate smoothed position
-            if len(self.motion_history) >= 2:
-                avg_x = sum(pos[0] for pos in self.motion_history) / len(self.motion_history)
-                avg_y = sum(pos[1] for pos in self.motion_history) / len(self.motion_history)
-                self.target_eye_position = (avg_x, avg_y)
-                self.target_left_eye = (avg_x, avg_y)
-                self.target_right_eye = (avg_x, avg_y)
-            else:
-                self.target_eye_position = (eye_x, eye_y)
-                self.target_left_eye = (eye_x, eye_y)
-                self.target_right_eye = (eye_x, eye_y)
+            # Add to motion history and aim at the smoothed position
+            self._set_smoothed_target(eye_x, eye_y)
                 
         elif motion_boxes and len(motion_boxes) > 0:
             # Motion detection mode - use motion position
             self.last_motion_time = time.time()
             
-            # Use the largest motion area (most significant movement)
-            largest_motion = max(motion_boxes, key=lambda m: m[2] * m[3])
-            x, y, w, h = largest_motion
+            # Use the largest motion area (most significant movement) - detect_motion sorts it first
+            x, y, w, h = motion_boxes[0]
             
             # Calculate motion center
             motion_center_x = x + w//2
             motion_center_y = y + h//2
             
-            # Normalize motion position (-1 to 1)
-            norm_x = (motion_center_x - self.camera_width//2) / (self.camera_width//2)
-            norm_y = (motion_center_y - self.camera_height//2) / (self.camera_height//2)
-            
-            # Map to display coordinates with larger range
-            eye_x = WIDTH//2 - norm_x * (WIDTH//2 - 20)  # Inverted X
-            eye_y = HEIGHT//2 + norm_y * (HEIGHT//2 - 20)  # Normal Y
-            
-            # Add to motion history for smoothing
-            self.motion_history.append((eye_x, eye_y))
-            if len(self.motion_history) > self.motion_history_size:
-                self.motion_history.pop(0)
+            # Map to display coordinates
+            eye_x, eye_y = self.camera_to_eye_position(motion_center_x, motion_center_y)
             
-            # Calculate smoothed position
-            if len(self.motion_history) >= 2:
-                # Average the last few positions to reduce shaking
-                avg_x = sum(pos[0] for pos in self.motion_history) / len(self.motion_history)
-                avg_y = sum(pos[1] for pos in self.motion_history) / len(self.motion_history)
-                self.target_eye_position = (avg_x, avg_y)
-                
-                # Set both eyes to the same position (synchronized movement)
-                self.target_left_eye = (avg_x, avg_y)
-                self.target_right_eye = (avg_x, avg_y)
-            else:
-                self.target_eye_position = (eye_x, eye_y)
-                self.target_left_eye = (eye_x, eye_y)
-                self.target_right_eye = (eye_x, eye_y)
+            # Add to motion history and aim at the smoothed position
+            self._set_smoothed_target(eye_x, eye_y)
         else:
             # No motion detected - check timeout
             if time.time() - self.last_motion_time > self.motion_timeout:
                 # Return to center after timeout
                 center_pos = (WIDTH//2, HEIGHT//2)
+                if self.target_left_eye != center_pos or self.target_right_eye != center_pos:
+                    self.eye_update_event.set()
                 self.target_eye_position = center_pos
                 self.target_left_eye = center_pos
                 self.target_right_eye = center_pos
                 self.motion_history.clear()  # Clear history when returning to center
     
+    def _set_smoothed_target(self, eye_x, eye_y):
+        """Add a position to the motion history and aim both eyes at the history average"""
+        # Fixed-length history - the deque drops the oldest position by itself
+        history = self.motion_history
+        history.append((eye_x, eye_y))
+        
+        if len(history) >= 2:
+            # Average the last few positions to reduce shaking
+            xs, ys = zip(*history)
+            target = (sum(xs) / len(history), sum(ys) / len(history))
+        else:
+            target = (eye_x, eye_y)
+        
+        # Set both eyes to the same position (synchronized movement)
+        if target != self.target_left_eye or target != self.target_right_eye:
+            self.eye_update_event.set()
+        self.target_eye_position = target
+        self.target_left_eye = target
+        self.target_right_eye = target
+    
     def smooth_eye_movement(self):
         """Smoothly interpolate eye movement for both eyes"""
+        # Eyes at rest - nothing to interpolate
+        if self.current_left_eye == self.target_left_eye and self.current_right_eye == self.target_right_eye:
+            return
+        
         # Choose movement speed based on transition state
         current_time = time.time()
         if self.transitioning_from_face_following:
@@ -624,8 +702,22 @@ class EyeTracker:
         new_left_x = current_left_x + (target_left_x - current_left_x) * movement_speed
         new_left_y = current_left_y + (target_left_y - current_left_y) * movement_speed
         
+        # Snap onto the target when close - the easing never arrives on its own, so the eyes
+        # would keep creeping by sub-pixel steps forever
+        if abs(target_left_x - new_left_x) < self.eye_snap_distance and abs(target_left_y - new_left_y) < self.eye_snap_distance:
+            new_left_x, new_left_y = target_left_x, target_left_y
+        
+        # Both eyes share one target and position (motion/face tracking) - reuse the left result
+        shared = self.target_right_eye == self.target_left_eye and self.current_right_eye == self.current_left_eye
+        
         self.current_left_eye = (new_left_x, new_left_y)
         
+        if shared:
+            self.current_right_eye = self.current_left_eye
+            # Keep backward compatibility
+            self.current_eye_position = self.current_left_eye
+            return
+        
         # Smooth right eye movement
         current_right_x, current_right_y = self.current_right_eye
         target_right_x, target_right_y = self.target_right_eye
@@ -633,6 +725,9 @@ class EyeTracker:
         new_right_x = current_right_x + (target_right_x - current_right_x) * movement_speed
         new_right_y = current_right_y + (target_right_y - current_right_y) * movement_speed
         
+        if abs(target_right_x - new_right_x) < self.eye_snap_distance and abs(target_right_y - new_right_y) < self.eye_snap_distance:
+            new_right_x, new_right_y = target_right_x, target_right_y
+        
         self.current_right_eye = (new_right_x, new_right_y)
         
         # Keep backward compatibility
@@ -668,6 +763,7 @@ class EyeTracker:
         self.idle_resume_delay = np.random.uniform(5, 10)  # 5-10 seconds delay before resuming
         
         print(f"Idle mode started. Will resume tracking after {self.idle_resume_delay:.1f}s")
+        self.eye_update_event.set()
     
     def exit_idle_mode(self):
         """Exit idle animation mode"""
@@ -681,6 +777,7 @@ class EyeTracker:
         self.target_left_eye = center_pos
         self.target_right_eye = center_pos
         self.motion_history.clear()
+        self.eye_update_event.set()
         
         print("Exited idle mode. Returning to motion tracking...")
     
@@ -709,31 +806,24 @@ class EyeTracker:
         left_pos, right_pos = self.idle_animations.get_current_positions()
         
         # Debug: print positions occasionally
-        if int(time.time()) != getattr(self, '_last_idle_debug', -1):
+        if int(time.time()) != self._last_idle_debug:
             self._last_idle_debug = int(time.time())
             print(f"Idle animation positions: Left={left_pos}, Right={right_pos}")
             # Also print blink states for debugging
-            if hasattr(self.idle_animations, 'left_blink_state'):
-                print(f"Blink states: Left={self.left_blink_state:.2f}, Right={self.right_blink_state:.2f}")
+            print(f"Blink states: Left={self.left_blink_state:.2f}, Right={self.right_blink_state:.2f}")
         
         # Update target positions
         self.target_left_eye = left_pos
         self.target_right_eye = right_pos
         
         # Handle special blink states from idle animations (animation 4)
-        if hasattr(self.idle_animations, 'left_blink_state') and hasattr(self.idle_animations, 'right_blink_state'):
-            # Override normal blinking with animation-specific blinking
-            self.left_blink_state = self.idle_animations.left_blink_state
-            self.right_blink_state = self.idle_animations.right_blink_state
-        else:
-            # Ensure blink states are always defined
-            self.left_blink_state = 1.0
-            self.right_blink_state = 1.0
+        # Override normal blinking with animation-specific blinking
+        self.left_blink_state = self.idle_animations.left_blink_state
+        self.right_blink_state = self.idle_animations.right_blink_state
     
-    def update_fps(self):
+    def update_fps(self, current_time):
         """Update FPS counter"""
         self.frame_count += 1
-        current_time = time.time()
         if current_time - self.last_fps_time >= 1.0:
             self.current_fps = self.frame_count / (current_time - self.last_fps_time)
             self.frame_count = 0
@@ -750,22 +840,25 @@ class EyeTracker:
         avg_display = sum(self.timing_display) / len(self.timing_display) if self.timing_display else 0
         avg_total = sum(self.timing_total) / len(self.timing_total)
         
-        # Calculate data transfer (full screen update)
-        full_screen_bytes = WIDTH * HEIGHT * 2  # Full screen RGB565
+        # Pixel bytes the SPI writers actually sent since the last report (dirty rectangles only)
+        displays = [d for d in (self.display1, self.display2) if d]
+        bytes_sent = sum(d.bytes_sent for d in displays)
+        for d in displays:
+            d.bytes_sent = 0
         
         print("=" * 60)
         print(f"FPS: {self.current_fps:.1f} | Frame Time: {avg_total:.1f}ms")
-        print(f"  Camera Capture:   {avg_capture:.2f}ms ({self.camera_width}x{self.camera_height} YUV)")
-        print(f"  Motion Detection: {avg_motion:.2f}ms (Frame Difference)")
-        print(f"  Display Update:    {avg_display:.2f}ms (full screen)")
+        print(f"  Camera Capture:   {avg_capture:.2f}ms ({self.detect_width}x{self.detect_height} lores Y plane)")
+        print(f"  Motion Detection: {avg_motion:.2f}ms (Background Difference)")
+        print(f"  Display Update:    {avg_display:.2f}ms (dirty rectangle)")
         print(f"  Other/Overhead:   {(avg_total - avg_capture - avg_motion):.2f}ms")
-        print(f"  Data Transfer:     {full_screen_bytes:,} bytes (full screen)")
-        print(f"  Camera Resolution: {self.camera_width}x{self.camera_height} (YUV420)")
-        print(f"  Motion Detection: Frame Difference + Contours")
+        print(f"  Data Transfer:     {bytes_sent:,} bytes since last report (both displays)")
+        print(f"  Camera Resolution: {self.camera_width}x{self.camera_height} main, {self.detect_width}x{self.detect_height} lores (YUV420)")
+        print(f"  Motion Detection: Running-Average Background + connectedComponentsWithStats")
         print(f"  Display Resolution: 240x240 (full resolution)")
         print(f"  Display FPS:       60 Hz (Pi 5 optimized)")
         print(f"  SPI Speed:         150 MHz (Pi 5 optimized)")
-        print(f"  Motion Tracking:   Every frame")
+        print(f"  Motion Tracking:   Every {self.motion_check_interval} frame(s) (adaptive, {self.motion_check_interval_quiet} when still)")
         
         # Calculate theoretical max FPS
         theoretical_fps = 1000.0 / avg_total if avg_total > 0 else 0
@@ -778,35 +871,87 @@ class EyeTracker:
         self.timing_display.clear()
         self.timing_total.clear()
     
+    def pin_current_thread(self, core, rt_priority=None):
+        """Pin the calling thread to one CPU core, optionally with SCHED_FIFO priority"""
+        try:
+            os.sched_setaffinity(0, {core})
+        except (AttributeError, OSError) as e:
+            print(f"Could not pin thread to core {core}: {e}")
+        
+        if rt_priority is not None:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(rt_priority))
+            except (AttributeError, OSError) as e:
+                print(f"Could not set real-time priority (run as root for steadier frame pacing): {e}")
+    
     def camera_thread(self):
         """Optimized camera thread with performance timing"""
+        self.pin_current_thread(self.camera_core)
+        
+        # Bind per-frame lookups once - they don't change while the thread runs
+        capture_request = self.camera.capture_request
+        camera_width = self.camera_width
+        camera_height = self.camera_height
+        detect_width = self.detect_width
+        detect_height = self.detect_height
+        detect_motion = self.detect_motion
+        
         while self.running:
             try:
+                # One clock read per stage boundary - each one ends a stage and starts the next
                 frame_start = time.time()
                 
-                # Capture frame for face detection
-                t0 = time.time()
-                frame = self.camera.capture_array()
-                capture_time = (time.time() - t0) * 1000  # ms
+                # Capture frame for face detection - zero-copy view of the camera buffer
+                request = capture_request()
+                t_captured = time.time()
+                capture_time = (t_captured - frame_start) * 1000  # ms
                 
-                # Motion detection (every frame for better tracking)
-                t1 = time.time()
-                motion_boxes = self.detect_motion(frame)
-                motion_time = (time.time() - t1) * 1000  # ms
-                
-                # Face detection (every 60 frames)
-                faces = []
-                face_detection_time = 0
-                self.face_detection_counter += 1
-                
-                if self.face_detection_counter >= self.face_detection_interval:
-                    t2 = time.time()
-                    faces = self.detect_face(frame)
-                    face_detection_time = (time.time() - t2) * 1000  # ms
-                    self.face_detection_counter = 0
-                    
-                    # Update face detection for color changes
-                    self.update_face_detection(faces)
+                try:
+                    with MappedArray(request, "lores") as mapped:
+                        # YUV420 arrives as one 2D (1.5*H, stride) array - keep the Y plane rows
+                        # and drop any stride padding columns
+                        frame = mapped.array[:detect_height, :detect_width]
+                        
+                        # Motion detection - every frame while something moves (and while idle,
+                        # where frames are already slow), every few frames once the scene is still
+                        if self.idle_mode or frame_start - self.last_motion_time < self.motion_quiet_time:
+                            self.motion_check_interval = 1
+                        else:
+                            self.motion_check_interval = self.motion_check_interval_quiet
+                        self.motion_check_counter += 1
+                        check_motion = self.motion_check_counter >= self.motion_check_interval
+                        
+                        # Face detection (every face_detection_interval frames)
+                        self.face_detection_counter += 1
+                        check_faces = self.face_detection_counter >= self.face_detection_interval
+                        
+                        motion_boxes = []
+                        if check_motion:
+                            motion_boxes = detect_motion(frame)
+                            self.motion_check_counter = 0
+                        t_motion = time.time()
+                        motion_time = (t_motion - t_captured) * 1000  # ms
+                        
+                        faces = []
+                        face_detection_time = 0
+                        
+                        if check_faces:
+                            faces = self.detect_face(frame)
+                            face_detection_time = (time.time() - t_motion) * 1000  # ms
+                            self.face_detection_counter = 0
+                            
+                            # Update face detection for color changes
+                            self.update_face_detection(faces)
+                        
+                    # Preview needs its own copy - the buffer goes back to the camera below
+                    # Only the full-size Y plane: the preview is grayscale, the chroma planes below it are not an image
+                    preview_frame = None
+                    if self.enable_preview and frame_start - self.last_preview_time >= self.preview_interval:
+                        with MappedArray(request, "main") as mapped:
+                            preview_frame = mapped.array[:camera_height, :camera_width].copy()
+                        self.last_preview_time = frame_start
+                finally:
+                    request.release()
                 
                 # Update eye position based on motion detection only
                 self.update_eye_position(motion_boxes)
@@ -816,28 +961,29 @@ class EyeTracker:
                 self.timing_motion.append(motion_time + face_detection_time)
                 
                 # Update FPS
-                self.update_fps()
+                frame_end = time.time()
+                self.update_fps(frame_end)
                 
                 # Total frame time
-                total_time = (time.time() - frame_start) * 1000
+                total_time = (frame_end - frame_start) * 1000
                 self.timing_total.append(total_time)
                 
                 # Print detailed performance every 2 seconds
-                if time.time() - self.last_perf_print >= 2.0:
+                if frame_end - self.last_perf_print >= 2.0:
                     self.print_performance()
-                    self.last_perf_print = time.time()
+                    self.last_perf_print = frame_end
                 
-                # Add frame to queue only if preview is enabled
-                if self.enable_preview and self.frame_queue:
-                    try:
-                        self.frame_queue.put_nowait((frame, motion_boxes, faces))
-                    except queue.Full:
-                        # Drop oldest frame
-                        try:
-                            self.frame_queue.get_nowait()
-                            self.frame_queue.put_nowait((frame, motion_boxes, faces))
-                        except:
-                            pass
+                # Add frame to queue only if preview is enabled (and due)
+                if preview_frame is not None and self.frame_queue is not None:
+                    # Replaces any frame the preview hasn't shown yet
+                    self.frame_queue.append((preview_frame, motion_boxes, faces))
+                
+                # Idle animations playing (no motion, no face) - nothing to track, so sample the
+                # scene at a lower rate until motion brings us back to full speed
+                if self.idle_mode:
+                    remaining = self.idle_frame_interval - (frame_end - frame_start)
+                    if remaining > 0:
+                        time.sleep(remaining)
                 
             except Exception as e:
                 print(f"Camera thread error: {e}")
@@ -845,6 +991,8 @@ class EyeTracker:
     
     def display_thread_func(self):
         """Display thread - LIMITED to 15 FPS to not block camera"""
+        self.pin_current_thread(self.display_core, self.display_rt_priority)
+        
         while self.running:
             try:
                 # Check if displays are initialized
@@ -894,13 +1042,27 @@ class EyeTracker:
                 # Update both displays
                 self._update_both_displays()
                 
-                # Pi 5 optimized: 60 FPS for smoother eye movement
-                time.sleep(1.0/60.0)
+                # Pi 5 optimized: 60 FPS for smoother eye movement - but once nothing is animating,
+                # park until the camera moves the eyes (or the next blink is due) so the core can idle
+                if self._display_at_rest():
+                    blink_due = self.last_blink_time + self.next_blink_delay - time.time()
+                    self.eye_update_event.wait(max(self.display_frame_interval, min(self.display_rest_timeout, blink_due)))
+                    self.eye_update_event.clear()
+                else:
+                    time.sleep(self.display_frame_interval)
                 
             except Exception as e:
                 print(f"Display thread error: {e}")
                 time.sleep(0.1)
     
+    def _display_at_rest(self):
+        """True when no eye movement, blink, idle animation, color or pupil change is in progress"""
+        return (not self.idle_mode and not self.is_blinking
+                and self.current_left_eye == self.target_left_eye
+                and self.current_right_eye == self.target_right_eye
+                and self.current_eye_color == self.target_eye_color
+                and abs(self.target_pupil_size_index - self.current_pupil_size_index) <= 0.1)
+    
     def _update_both_displays(self):
         """Update both displays with current eye positions"""
         # Get current eye positions
@@ -921,43 +1083,31 @@ class EyeTracker:
         
         # Check for blink changes - use individual states for idle mode
         if self.idle_mode:
-            left_blink_changed = (self.left_blink_state != getattr(self, 'last_left_blink_state', 1.0))
-            right_blink_changed = (self.right_blink_state != getattr(self, 'last_right_blink_state', 1.0))
+            left_blink_changed = (self.left_blink_state != self.last_left_blink_state)
+            right_blink_changed = (self.right_blink_state != self.last_right_blink_state)
             blink_changed = left_blink_changed or right_blink_changed
         else:
-            blink_changed = self.is_blinking and (self.blink_state != getattr(self, 'last_blink_state', 1.0))
+            blink_changed = self.is_blinking and (self.blink_state != self.last_blink_state)
         
         if left_changed or blink_changed:
             t0 = time.time()
             
-            # Use separate blink states if in idle mode
-            if self.idle_mode and hasattr(self, 'left_blink_state'):
-                left_blink_value = self.left_blink_state
-            else:
-                left_blink_value = self.blink_state
-            
-            # Generate left eye image
-            rgb565_bytes_left = self.create_eye_image(int(left_eye_x), int(left_eye_y), left_blink_value, self.eye_cache_left)
+            # Generate left eye image (separate blink states in idle mode, picked above)
+            rgb565_bytes_left = self.create_eye_image(int(left_eye_x), int(left_eye_y), left_blink_for_cache)
             
-            # Update left display
-            self._send_to_display(self.display1, rgb565_bytes_left)
+            # Update left display (sent by its SPI writer thread)
+            self.spi_slot_left.put(rgb565_bytes_left)
             
             self.last_rendered_pos_left = left_rounded_pos
         
         if right_changed or blink_changed:
             t0 = time.time()
             
-            # Use separate blink states if in idle mode
-            if self.idle_mode and hasattr(self, 'right_blink_state'):
-                right_blink_value = self.right_blink_state
-            else:
-                right_blink_value = self.blink_state
-            
-            # Generate right eye image
-            rgb565_bytes_right = self.create_eye_image(int(right_eye_x), int(right_eye_y), right_blink_value, self.eye_cache_right)
+            # Generate right eye image (separate blink states in idle mode, picked above)
+            rgb565_bytes_right = self.create_eye_image(int(right_eye_x), int(right_eye_y), right_blink_for_cache)
             
-            # Update right display
-            self._send_to_display(self.display2, rgb565_bytes_right)
+            # Update right display (sent by its SPI writer thread)
+            self.spi_slot_right.put(rgb565_bytes_right)
             
             self.last_rendered_pos_right = right_rounded_pos
         
@@ -974,6 +1124,21 @@ class EyeTracker:
     def _send_to_display(self, display, rgb565_bytes):
         """Send RGB565 data to a specific display"""
         send_to_display(display, rgb565_bytes)
+    
+    def spi_writer_thread(self, display, spi_slot):
+        """SPI writer thread - streams queued frames to one display so rendering never blocks on SPI"""
+        self.pin_current_thread(self.spi_core)
+        
+        while self.running:
+            rgb565_bytes = spi_slot.get(timeout=0.1)
+            if rgb565_bytes is None:
+                continue
+            
+            try:
+                self._send_to_display(display, rgb565_bytes)
+            except Exception as e:
+                print(f"SPI writer error: {e}")
+                time.sleep(0.1)
                 
 
     def start(self):
@@ -984,6 +1149,13 @@ class EyeTracker:
     def stop(self):
         """Stop the eye tracker"""
         self.running = False
+        self.eye_update_event.set()  # Wake a parked display thread so it sees running=False
+        
+        # Let the workers finish their current frame first - the camera thread may hold a
+        # capture request, the SPI writers may be mid-transfer on the spidev handles
+        for thread in [self._camera_thread, self.display_thread] + self._spi_threads:
+            if thread is not None:
+                thread.join(timeout=self.thread_join_timeout)
         
         if self.display1:
             self.display1.close()